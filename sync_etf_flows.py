@@ -15,19 +15,218 @@ Author: Expert Python Developer
 Date: 2025-11-17
 """
 
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
 from datetime import datetime, timedelta
+import functools
+import io
+import itertools
+import json
+import math
 from pathlib import Path
+import re
 import sys
-from typing import Dict, Any, Optional
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Iterable, Iterator, Optional, Sequence, Tuple
+from openpyxl import load_workbook
+from openpyxl.cell.cell import Cell
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from openpyxl.utils import get_column_letter
 import yfinance as yf
 
+# Prefer the Rust-based calamine reader when available; it parses xlsx
+# several times faster than openpyxl and yields identical DataFrames.
+try:
+    from python_calamine import CalamineWorkbook
+    EXCEL_READ_ENGINE = 'calamine'
+except ImportError:
+    CalamineWorkbook = None
+    EXCEL_READ_ENGINE = 'openpyxl'
+
+# JIT-compile the statistics kernels when numba is installed; plain Python otherwise.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Number of jobs processed concurrently. Jobs are dominated by Yahoo Finance
+# round-trips, so a small pool gives most of the win without tripping rate limits.
+MAX_JOB_WORKERS = 8
+
+# Mapping of sheet names to ticker symbols for VWAP
+_VWAP_MAPPING = MappingProxyType({
+    'S&P 500 ETF': 'ES=F',
+    'Nasdaq 100 ETF': 'NQ=F',
+    'Russel 2000 ETF': 'RTY=F',
+    'Bonds': 'TLT',
+    'Gold ETF': 'GC=F',
+    'Silver ETF': 'SI=F',
+    'Brent ETF': 'BZ=F',
+    'Natural Gas': 'NG=F',
+    'Palladium ETF': 'PA=F',
+    'Platinum ETF': 'PL=F',
+    'Copper ETF': 'HG=F',
+    'SEMIC': 'SMH',
+    'NVDA': 'NVDA',
+    'AVGO': 'AVGO',
+    'TSLA': 'TSLA',
+    'META': 'META',
+    'AAPL': 'AAPL',
+    'MSFT': 'MSFT',
+    'GOOG': 'GOOG',
+    'PANW': 'PANW',
+    'IBIT': 'IBIT',
+    'ETHA': 'ETHA',
+    'SOL': 'SOL-USD',
+    'BOFA': 'BAC',
+})
+
+# Job configurations (one per destination sheet), kept next to this script
+JOBS_FILE = Path(__file__).with_name('jobs.json')
+
+# Index futures whose VWAP is approximated by the daily (High + Low) / 2
+SIMPLE_AVG_TICKERS = frozenset({'ES=F', 'NQ=F', 'RTY=F'})
+
+# yfinance objects and VWAP results reused across jobs within a run
+_TICKER_CACHE: Dict[str, yf.Ticker] = {}
+_VWAP_CACHE: Dict[Tuple[str, str], Optional[float]] = {}
+
+# Flow column header in the Bloomberg export: one holding both "Flow" and "(M USD)",
+# in either order and possibly wrapped onto two lines (e.g. "1D Flow\n(M USD)"), or a
+# bare " (M USD)" under a merged "1D Flow" caption. Case-sensitive, so "Outflow (M USD)"
+# is not taken for the flow column
+_FLOW_COL_RE = re.compile(r'^(?=.*Flow)(?=.*\(M\s*USD\))|^\s*\(M\s*USD\)\s*$', re.DOTALL)
+
+# Leverage indicator in a column name, e.g. "(3x L)", "(2x S)", "(1.25x L)"
+_LEVERAGE_RE = re.compile(r'\((\d+(?:\.\d+)?)\s*x\s*([ls])\)', re.IGNORECASE)
+
+# Row labels of a statistics table, top to bottom; both the per-sheet tables and
+# the ALL dashboard are built from this tuple
+STATISTICS_ROWS = ("LAST DAY", "LAST 5 DAYS", "LAST 20 DAYS")
+STATISTICS_LABELS = frozenset(STATISTICS_ROWS)
+
+# Trailing rows of a sheet searched for its statistics tables before falling
+# back to the whole sheet
+STATS_SCAN_ROWS = 50
+
+# Statistics table styles shared by the per-sheet tables and the ALL dashboard;
+# openpyxl style objects are immutable, so one instance serves every cell
+NUMFMT = '#,##0.00'
+THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+TICKER_FONT = Font(bold=True, italic=True, color="FF0000", size=11)  # Red italic
+HEADER_FONT = Font(italic=True, bold=False, size=10)
+LABEL_FONT = Font(bold=True, italic=True, size=10)
+CENTER_ALIGN = Alignment(horizontal="center", vertical="center")
+RIGHT_ALIGN = Alignment(horizontal="right", vertical="center")
+GREEN_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+RED_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+FILLS = (RED_FILL, GREEN_FILL)  # indexed by flow > 0
+
+# Element-wise over an object array: text cells stripped, every other cell ''
+# (used to find the statistics labels in a sheet)
+_strip_text_cells = np.frompyfunc(lambda v: v.strip() if isinstance(v, str) else '', 1, 1)
+
+
+def _stream_source_sheets(source_file: str) -> Iterator[Tuple[str, Optional[Sequence], Callable[[int], Iterable]]]:
+    """
+    Yield (sheet_name, header, read_rows) for every sheet of the source workbook.
+
+    header is the first row's values (None for an empty sheet). read_rows(max_col)
+    returns the data rows as plain sequences covering at least the first max_col
+    columns; the openpyxl reader skips the cells beyond them. Nothing is
+    materialized as a DataFrame.
+    """
+    if CalamineWorkbook is not None:
+        workbook = CalamineWorkbook.from_path(source_file)
+        try:
+            print(f"[INFO] Found {len(workbook.sheet_names)} sheet(s) in source file")
+            for sheet_name in workbook.sheet_names:
+                rows = workbook.get_sheet_by_name(sheet_name).to_python(skip_empty_area=True)
+                header = rows[0] if rows else None
+                yield sheet_name, header, lambda max_col, rows=rows: itertools.islice(rows, 1, None)
+        finally:
+            # CalamineWorkbook.close() only exists from python-calamine 0.3.0
+            close = getattr(workbook, 'close', None)
+            if close is not None:
+                close()
+    else:
+        workbook = load_workbook(source_file, read_only=True, data_only=True)
+        try:
+            print(f"[INFO] Found {len(workbook.sheetnames)} sheet(s) in source file")
+            for sheet_name in workbook.sheetnames:
+                ws = workbook[sheet_name]
+                header = next(ws.iter_rows(max_row=1, values_only=True), None)
+                yield sheet_name, header, lambda max_col, ws=ws: ws.iter_rows(
+                    min_row=2, max_col=max_col, values_only=True)
+        finally:
+            workbook.close()
+
+
+def _locate_flow_columns(header: Optional[Iterable], sheet_name: str) -> Optional[Tuple[int, int]]:
+    """
+    Find the (ticker, flow) column positions in a source sheet's header row.
+
+    Returns None (after printing a warning) when either column is missing.
+    """
+    header = ['' if value is None else str(value) for value in (header or ())]
+    if 'Ticker' not in header:
+        print(f"[WARNING] 'Ticker' column not found in sheet '{sheet_name}', skipping...")
+        return None
+
+    # Look for the flow column - usually named " (M USD)" with a leading space;
+    # the first header matching either form wins
+    flow_idx = next((idx for idx, col in enumerate(header) if _FLOW_COL_RE.search(col)), None)
+
+    if flow_idx is None:
+        print(f"[WARNING] Flow column ' (M USD)' not found in sheet '{sheet_name}', skipping...")
+        return None
+
+    print(f"[INFO] Using flow column: '{header[flow_idx]}'")
+    return header.index('Ticker'), flow_idx
+
+
+def _iter_sheet_flows(rows: Iterable, ticker_idx: int, flow_idx: int) -> Iterator[Tuple[str, float]]:
+    """
+    Yield (ticker, flow) pairs from a source sheet's data rows.
+
+    Skips rows without a ticker, with "Median" as ticker, or without a flow value.
+    Unparseable flow values are reported and skipped.
+    """
+    width = max(ticker_idx, flow_idx) + 1
+    for row in rows:
+        if len(row) < width:
+            continue
+        raw_ticker, raw_flow = row[ticker_idx], row[flow_idx]
+        if raw_ticker is None or raw_flow is None or raw_flow == '':
+            continue
+        ticker = str(raw_ticker).strip()
+        if not ticker or ticker == 'Median':
+            continue
+
+        try:
+            flow_value = float(raw_flow)
+        except (TypeError, ValueError):
+            flow_value = float('nan')
+        if flow_value != flow_value:
+            print(f"[WARNING] Invalid flow value for ticker '{raw_ticker}': {raw_flow}")
+            continue
+
+        yield ticker, flow_value
+
 
 def create_flow_lookup(source_file: str) -> Dict[str, float]:
     """
     Read the source Bloomberg export Excel file and create a ticker-to-flow lookup map.
 
-    This function reads ALL sheets from the source file and combines them into a single
+    This function streams ALL sheets from the source file and combines them into a single
     dictionary mapping ticker symbols to their 1D flow values.
 
     Args:
@@ -48,58 +247,20 @@ def create_flow_lookup(source_file: str) -> Dict[str, float]:
     flow_map = {}
 
     try:
-        # Read ALL sheets from the Excel file
-        all_sheets = pd.read_excel(source_file, sheet_name=None, engine='openpyxl')
-
-        print(f"[INFO] Found {len(all_sheets)} sheet(s) in source file")
-
-        for sheet_name, df in all_sheets.items():
+        for sheet_name, header, read_rows in _stream_source_sheets(source_file):
             print(f"[INFO] Processing sheet: {sheet_name}")
 
-            # Check if required columns exist
-            if 'Ticker' not in df.columns:
-                print(f"[WARNING] 'Ticker' column not found in sheet '{sheet_name}', skipping...")
+            columns = _locate_flow_columns(header, sheet_name)
+            if columns is None:
                 continue
 
-            # Look for the flow column - it should be named " (M USD)" with a leading space
-            # We'll try multiple variations to be robust
-            flow_column = None
-            for col in df.columns:
-                if '(M USD)' in str(col) and 'Flow' in str(col):
-                    flow_column = col
-                    break
-                elif col == ' (M USD)':
-                    flow_column = col
-                    break
-
-            if flow_column is None:
-                print(f"[WARNING] Flow column ' (M USD)' not found in sheet '{sheet_name}', skipping...")
-                continue
+            # Only the columns up to the ticker/flow columns are read from here on
+            rows = read_rows(max(columns) + 1)
 
-            print(f"[INFO] Using flow column: '{flow_column}'")
-
-            # Process each row
             row_count = 0
-            for idx, row in df.iterrows():
-                ticker = row.get('Ticker')
-                flow_value = row.get(flow_column)
-
-                # Skip rows without a ticker or with "Median" as ticker
-                if pd.isna(ticker) or str(ticker).strip() == '' or str(ticker).strip() == 'Median':
-                    continue
-
-                # Skip rows without a valid flow value
-                if pd.isna(flow_value):
-                    continue
-
-                # Convert flow value to float
-                try:
-                    flow_value = float(flow_value)
-                    flow_map[str(ticker).strip()] = flow_value
-                    row_count += 1
-                except (ValueError, TypeError):
-                    print(f"[WARNING] Invalid flow value for ticker '{ticker}': {flow_value}")
-                    continue
+            for ticker, flow_value in _iter_sheet_flows(rows, *columns):
+                flow_map[ticker] = flow_value
+                row_count += 1
 
             print(f"[INFO] Extracted {row_count} ticker(s) from sheet '{sheet_name}'")
 
@@ -115,6 +276,7 @@ def create_flow_lookup(source_file: str) -> Dict[str, float]:
         raise
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_multiplier_from_column_name(column_name: str) -> float:
     """
     Parse the multiplier from a column name based on leverage indicators.
@@ -127,32 +289,24 @@ def parse_multiplier_from_column_name(column_name: str) -> float:
         "TSL(1.25x L)" -> 1.25 (Long 1.25x)
         "Regular Column" -> 1.0 (No multiplier)
 
+    Results are memoized, so each distinct column name is parsed once per run.
+
     Args:
         column_name: The column name to parse
 
     Returns:
         The multiplier (positive for Long, negative for Short)
     """
-    import re
-
-    column_lower = column_name.lower()
-
     # Look for pattern like "(3x L)" or "(3x S)" or "(1.25x L)"
-    # Match patterns: (NUMBERx L) or (NUMBERx S)
-    pattern = r'\((\d+(?:\.\d+)?)\s*x\s*([ls])\)'
-    match = re.search(pattern, column_lower)
-
-    if match:
-        multiplier = float(match.group(1))
-        direction = match.group(2)  # 'l' for long, 's' for short
-
-        if direction == 's':
-            return -multiplier
-        else:
-            return multiplier
+    match = _LEVERAGE_RE.search(column_name)
 
     # No multiplier found, return 1.0
-    return 1.0
+    if not match:
+        return 1.0
+
+    multiplier = float(match.group(1))
+    # 'l' for long, 's' for short
+    return -multiplier if match.group(2).lower() == 's' else multiplier
 
 
 def get_vwap_ticker_for_sheet(sheet_name: str) -> Optional[str]:
@@ -165,35 +319,7 @@ def get_vwap_ticker_for_sheet(sheet_name: str) -> Optional[str]:
     Returns:
         Ticker symbol (e.g., "SPY", "QQQ", "TSLA") or None if not found
     """
-    # Mapping of sheet names to ticker symbols for VWAP
-    vwap_mapping = {
-        'S&P 500 ETF': 'ES=F',
-        'Nasdaq 100 ETF': 'NQ=F',
-        'Russel 2000 ETF': 'RTY=F',
-        'Bonds': 'TLT',
-        'Gold ETF': 'GC=F',
-        'Silver ETF': 'SI=F',
-        'Brent ETF': 'BZ=F',
-        'Natural Gas': 'NG=F',
-        'Palladium ETF': 'PA=F',
-        'Platinum ETF': 'PL=F',
-        'Copper ETF': 'HG=F',
-        'SEMIC': 'SMH',
-        'NVDA': 'NVDA',
-        'AVGO': 'AVGO',
-        'TSLA': 'TSLA',
-        'META': 'META',
-        'AAPL': 'AAPL',
-        'MSFT': 'MSFT',
-        'GOOG': 'GOOG',
-        'PANW': 'PANW',
-        'IBIT': 'IBIT',
-        'ETHA': 'ETHA',
-        'SOL': 'SOL-USD',
-        'BOFA': 'BAC',
-    }
-
-    return vwap_mapping.get(sheet_name)
+    return _VWAP_MAPPING.get(sheet_name)
 
 
 def calculate_vwap(df: pd.DataFrame) -> Optional[float]:
@@ -208,28 +334,25 @@ def calculate_vwap(df: pd.DataFrame) -> Optional[float]:
         df: DataFrame with OHLCV data
 
     Returns:
-        Last VWAP value or None if calculation fails
+        Last VWAP value, or None if calculation fails or there is no volume
     """
     try:
         if df.empty or 'Volume' not in df.columns:
             return None
 
-        # Make an explicit copy to avoid SettingWithCopyWarning
-        df = df.copy()
-
-        # Calculate Typical Price (HLC/3)
-        df['Typical_Price'] = (df['High'] + df['Low'] + df['Close']) / 3
+        high = df['High'].to_numpy(dtype=np.float64)
+        low = df['Low'].to_numpy(dtype=np.float64)
+        close = df['Close'].to_numpy(dtype=np.float64)
+        volume = df['Volume'].to_numpy(dtype=np.float64)
 
-        # Calculate cumulative (Typical_Price * Volume) and cumulative Volume
-        df['TP_Volume'] = df['Typical_Price'] * df['Volume']
-        df['Cum_TP_Volume'] = df['TP_Volume'].cumsum()
-        df['Cum_Volume'] = df['Volume'].cumsum()
-
-        # Calculate VWAP
-        df['VWAP'] = df['Cum_TP_Volume'] / df['Cum_Volume']
+        # The last cumulative VWAP is just the ratio of the two running totals at the end,
+        # so only the totals are needed: Σ(Typical_Price × Volume) / Σ(Volume)
+        typical_price = (high + low + close) * (1.0 / 3.0)
+        total_volume = float(volume.sum())
+        if not total_volume:
+            return None
 
-        # Return the last VWAP value
-        return df['VWAP'].iloc[-1]
+        return float((typical_price * volume).sum()) / total_volume
 
     except Exception as e:
         return None
@@ -241,6 +364,9 @@ def fetch_vwap_for_date(ticker: str, date: str) -> Optional[float]:
     Uses custom cumulative VWAP calculation.
     For S&P, NASDAQ, and Russel indices, uses (High + Low) / 2 instead.
 
+    Results (including misses) are cached per (ticker, date) for the rest of the run,
+    so repeated requests do not go back to Yahoo Finance.
+
     Args:
         ticker: Ticker symbol (e.g., "SPY", "TSLA", "GC=F", "SI=F")
         date: Date in YYYY-MM-DD format
@@ -248,14 +374,23 @@ def fetch_vwap_for_date(ticker: str, date: str) -> Optional[float]:
     Returns:
         VWAP value or None if data not available
     """
+    key = (ticker, date)
+    if key not in _VWAP_CACHE:
+        _VWAP_CACHE[key] = _download_vwap(ticker, date)
+    return _VWAP_CACHE[key]
+
+
+def _download_vwap(ticker: str, date: str) -> Optional[float]:
+    """Download price data for ticker and compute the VWAP for date (see fetch_vwap_for_date)."""
     try:
         # Convert date string to datetime
         target_date = datetime.strptime(date, "%Y-%m-%d")
-        stock = yf.Ticker(ticker)
+        stock = _TICKER_CACHE.get(ticker)
+        if stock is None:
+            stock = _TICKER_CACHE[ticker] = yf.Ticker(ticker)
 
         # Special tickers that use (High + Low) / 2 instead of VWAP
-        simple_avg_tickers = ['ES=F', 'NQ=F', 'RTY=F']
-        use_simple_avg = ticker in simple_avg_tickers
+        use_simple_avg = ticker in SIMPLE_AVG_TICKERS
 
         # Try to fetch intraday data for better VWAP calculation
         if not use_simple_avg:
@@ -287,29 +422,137 @@ def fetch_vwap_for_date(ticker: str, date: str) -> Optional[float]:
             return None
 
         # Find the row for our target date
-        df.index = pd.to_datetime(df.index).date
-        target_date_obj = target_date.date()
-
-        if target_date_obj not in df.index:
+        row = _bar_for_date(df, target_date)
+        if row is None:
             print(f"[WARNING] No price data for {ticker} on {date} (market closed?)")
             return None
 
-        row = df.loc[target_date_obj]
-
-        # For S&P, NASDAQ, Russel: use (High + Low) / 2
-        # For others: use typical price (High + Low + Close) / 3
-        if use_simple_avg:
-            vwap = (row['High'] + row['Low']) / 2
-        else:
-            vwap = (row['High'] + row['Low'] + row['Close']) / 3
-
-        return round(vwap, 2)
+        return round(_daily_bar_price(row, use_simple_avg), 2)
 
     except Exception as e:
         print(f"[ERROR] Failed to fetch VWAP for {ticker} on {date}: {str(e)}")
         return None
 
 
+def _bar_for_date(df: pd.DataFrame, target_date: datetime) -> Optional[pd.Series]:
+    """
+    Return the daily bar for target_date (the last one if there are several), or None.
+
+    Bars are matched on their local exchange date with a datetime64 mask.
+    """
+    index = pd.DatetimeIndex(df.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    mask = index.normalize() == pd.Timestamp(target_date).normalize()
+    if not mask.any():
+        return None
+    return df.loc[mask].iloc[-1]
+
+
+def _daily_bar_price(row: pd.Series, use_simple_avg: bool) -> float:
+    """
+    Approximate the VWAP from a daily bar.
+
+    For S&P, NASDAQ, Russel: use (High + Low) / 2
+    For others: use typical price (High + Low + Close) / 3
+    """
+    if use_simple_avg:
+        return (row['High'] + row['Low']) / 2
+    return (row['High'] + row['Low'] + row['Close']) / 3
+
+
+def _batch_frame(hist: pd.DataFrame, ticker: str) -> pd.DataFrame:
+    """Extract one ticker's bars from a yf.download(group_by='ticker') result."""
+    if isinstance(hist.columns, pd.MultiIndex):
+        if ticker not in hist.columns.get_level_values(0):
+            return pd.DataFrame()
+        hist = hist[ticker]
+    # Batched frames share one index across tickers; drop the bars this ticker doesn't have
+    return hist.dropna(how='all')
+
+
+def prefetch_vwaps(tickers: list, date: str) -> None:
+    """
+    Download the price data for many tickers in batched requests and fill the VWAP cache.
+
+    Applies the same rules as fetch_vwap_for_date: 5-minute bars for regular tickers,
+    the daily bar for the index futures and for any ticker without usable intraday
+    data. Tickers still without a value are left uncached, so fetch_vwap_for_date
+    retries them one by one and reports the problem.
+
+    Args:
+        tickers: Ticker symbols to prefetch
+        date: Date in YYYY-MM-DD format
+    """
+    target_date = datetime.strptime(date, "%Y-%m-%d")
+    end = (target_date + timedelta(days=1)).strftime("%Y-%m-%d")
+    pending = sorted(set(tickers))
+    intraday = [ticker for ticker in pending if ticker not in SIMPLE_AVG_TICKERS]
+
+    try:
+        if intraday:
+            hist = yf.download(intraday, start=date, end=end, interval='5m',
+                               group_by='ticker', threads=True, progress=False)
+            for ticker in intraday:
+                df = _batch_frame(hist, ticker)
+                if len(df) > 1:
+                    vwap_value = calculate_vwap(df.dropna())
+                    if vwap_value is not None:
+                        _VWAP_CACHE[(ticker, date)] = round(vwap_value, 2)
+
+        daily = [ticker for ticker in pending if (ticker, date) not in _VWAP_CACHE]
+        if daily:
+            start = (target_date - timedelta(days=5)).strftime("%Y-%m-%d")
+            hist = yf.download(daily, start=start, end=end, group_by='ticker', threads=True, progress=False)
+            for ticker in daily:
+                row = _bar_for_date(_batch_frame(hist, ticker), target_date)
+                if row is not None:
+                    vwap = _daily_bar_price(row, ticker in SIMPLE_AVG_TICKERS)
+                    if pd.notna(vwap):
+                        _VWAP_CACHE[(ticker, date)] = round(vwap, 2)
+
+    except Exception as e:
+        print(f"[WARNING] Batched VWAP download failed, fetching per ticker: {str(e)}")
+        return
+
+    print(f"[INFO] Prefetched VWAP for {sum((t, date) in _VWAP_CACHE for t in pending)}/{len(pending)} ticker(s)")
+
+
+def tail_stats(a: np.ndarray, n: int) -> Tuple[float, float]:
+    """
+    Sum and mean of the non-NaN values among the last n entries of a float64 array.
+
+    Returns (0.0, 0.0) when the window holds no values. Compiled with numba when
+    it is available.
+    """
+    total = 0.0
+    count = 0
+    for i in range(max(len(a) - n, 0), len(a)):
+        value = a[i]
+        if value == value:
+            total += value
+            count += 1
+    return total, (total / count if count else 0.0)
+
+
+if njit is not None:
+    tail_stats = njit(cache=True)(tail_stats)
+
+
+def weighted_tail_mean(values: np.ndarray, weights: np.ndarray, n: int) -> float:
+    """
+    Weighted mean over the last n entries: Σ(values) / Σ(weights) on the rows where values is not NaN.
+
+    Returns 0.0 when the window has no values or their weights sum to zero.
+    """
+    values, weights = values[-n:], weights[-n:]
+    present = ~np.isnan(values)
+    total_weight = np.nansum(weights[present])
+    if not present.any() or total_weight == 0:
+        return 0.0
+    return float(np.nansum(values[present]) / total_weight)
+
+
 def calculate_adjusted_total_flow(df: pd.DataFrame, row_idx: int, job_config: Dict[str, Any]) -> float:
     """
     Calculate the Adjusted Total Flow for a row by summing all flow columns except VWAP.
@@ -327,16 +570,13 @@ def calculate_adjusted_total_flow(df: pd.DataFrame, row_idx: int, job_config: Di
     total = 0.0
 
     if job_type == 'complex':
-        # For complex types, sum all mapped columns (already multiplied)
-        mapping = job_config.get('mapping', {})
-        for column_name in mapping.keys():
-            if column_name in df.columns:
-                value = df.at[row_idx, column_name]
-                if pd.notna(value):
-                    try:
-                        total += float(value)
-                    except (ValueError, TypeError):
-                        pass
+        # For complex types, sum all mapped columns (already multiplied) in one vectorized pass;
+        # missing and non-numeric cells are coerced to NaN and ignored
+        mapped_cols = job_config.get('_cols') or list(job_config.get('mapping', {}).keys())
+        cols = [col for col in mapped_cols if col in df.columns]
+        if cols:
+            values = pd.to_numeric(df.loc[row_idx, cols], errors='coerce').to_numpy(dtype=np.float64)
+            total = float(np.nansum(values))
     elif job_type == 'simple':
         # For simple types, just get the single flow column value (already multiplied)
         flow_column = job_config.get('flow_column')
@@ -351,236 +591,358 @@ def calculate_adjusted_total_flow(df: pd.DataFrame, row_idx: int, job_config: Di
     return total
 
 
-def update_statistics_table(df: pd.DataFrame, sheet_name: str, adjusted_total_col: str, vwap_col: Optional[str]) -> pd.DataFrame:
+def update_statistics_table(df: pd.DataFrame, sheet_name: str, adjusted_total_col: str, vwap_col: Optional[str],
+                            product_col: Optional[str] = None,
+                            precomputed_last: Optional[Tuple[Any, Any, Any]] = None) -> pd.DataFrame:
     """
     Update the statistics table (LAST DAY, LAST 5 DAYS, LAST 20 DAYS) in the sheet.
 
     Args:
-        df: DataFrame containing the sheet data
+        df: DataFrame containing the sheet data (Date column already parsed to datetime)
         sheet_name: Name of the sheet being processed
         adjusted_total_col: Name of the adjusted total flow column
         vwap_col: Name of the VWAP column (None for simple sheets without separate VWAP)
+        product_col: Name of the Product column, used for the weighted average VWAP
+        precomputed_last: Optional (row index, adjusted total, VWAP) just written by the
+            caller; reused for the LAST DAY values when that row is the latest data row
 
     Returns:
         Updated DataFrame with statistics
     """
-    # Find rows with valid date and flow data (exclude statistics rows)
-    valid_data_mask = df['Date'].notna() & pd.to_datetime(df['Date'], errors='coerce').notna()
-    valid_data = df[valid_data_mask].copy()
-
-    if len(valid_data) == 0:
+    if adjusted_total_col not in df.columns:
         return df
 
-    # Filter to only rows with valid adjusted total flow values
-    if adjusted_total_col in valid_data.columns:
-        valid_data = valid_data[valid_data[adjusted_total_col].notna()].copy()
+    # Positions of rows with a valid date and adjusted total flow (excludes statistics rows)
+    valid_rows = np.flatnonzero((df['Date'].notna() & df[adjusted_total_col].notna()).to_numpy())
 
-    if len(valid_data) == 0:
+    if len(valid_rows) == 0:
         return df
 
-    # Get the last N days of data
-    last_day_data = valid_data.iloc[-1:] if len(valid_data) >= 1 else None
-    last_5_days_data = valid_data.iloc[-5:] if len(valid_data) >= 5 else valid_data
-    last_20_days_data = valid_data.iloc[-20:] if len(valid_data) >= 20 else valid_data
+    has_vwap = bool(vwap_col) and vwap_col in df.columns
 
     # Calculate statistics
     stats = {}
 
-    if last_day_data is not None and adjusted_total_col in valid_data.columns:
-        stats['last_day_flow'] = last_day_data[adjusted_total_col].iloc[0]
-
-        # For VWAP, find the most recent row with a valid VWAP value
-        if vwap_col and vwap_col in df.columns:
-            valid_vwap_data = valid_data[valid_data[vwap_col].notna()]
-            if len(valid_vwap_data) > 0:
-                stats['last_day_vwap'] = valid_vwap_data[vwap_col].iloc[-1]
-
-    if adjusted_total_col in valid_data.columns:
-        stats['last_5_days_flow'] = last_5_days_data[adjusted_total_col].sum()
-        stats['last_20_days_flow'] = last_20_days_data[adjusted_total_col].sum()
-
-        if vwap_col and vwap_col in valid_data.columns:
-            # Find Product column
-            product_col = None
-            for col in df.columns:
-                if 'product' in str(col).lower():
-                    product_col = col
-                    break
-
-            # Calculate weighted average VWAP using Product column
-            # Weighted Average VWAP = Sum(Products) / Sum(Adjusted Totals)
-            if product_col and product_col in valid_data.columns:
-                # For LAST 5 DAYS
-                last_5_products = last_5_days_data[last_5_days_data[product_col].notna()][product_col]
-                last_5_flows = last_5_days_data[last_5_days_data[product_col].notna()][adjusted_total_col]
-
-                if len(last_5_products) > 0 and last_5_flows.sum() != 0:
-                    stats['last_5_days_vwap'] = last_5_products.sum() / last_5_flows.sum()
-                else:
-                    stats['last_5_days_vwap'] = 0.0
-
-                # For LAST 20 DAYS
-                last_20_products = last_20_days_data[last_20_days_data[product_col].notna()][product_col]
-                last_20_flows = last_20_days_data[last_20_days_data[product_col].notna()][adjusted_total_col]
-
-                if len(last_20_products) > 0 and last_20_flows.sum() != 0:
-                    stats['last_20_days_vwap'] = last_20_products.sum() / last_20_flows.sum()
-                else:
-                    stats['last_20_days_vwap'] = 0.0
-            else:
-                # Fallback to simple average if Product column not found
-                last_5_vwap = last_5_days_data[last_5_days_data[vwap_col].notna()][vwap_col]
-                last_20_vwap = last_20_days_data[last_20_days_data[vwap_col].notna()][vwap_col]
+    if precomputed_last is not None and precomputed_last[0] == df.index[valid_rows[-1]]:
+        _, stats['last_day_flow'], last_vwap = precomputed_last
+    else:
+        stats['last_day_flow'] = df[adjusted_total_col].iat[valid_rows[-1]]
+        last_vwap = None
 
-                stats['last_5_days_vwap'] = last_5_vwap.mean() if len(last_5_vwap) > 0 else 0.0
-                stats['last_20_days_vwap'] = last_20_vwap.mean() if len(last_20_vwap) > 0 else 0.0
+    # For VWAP, find the most recent row with a valid VWAP value
+    if has_vwap:
+        if pd.notna(last_vwap):
+            stats['last_day_vwap'] = last_vwap
+        else:
+            vwap_values = df[vwap_col].to_numpy(dtype=object)[valid_rows]
+            vwap_present = np.flatnonzero(pd.notna(vwap_values))
+            if len(vwap_present) > 0:
+                stats['last_day_vwap'] = vwap_values[vwap_present[-1]]
+
+    # Tail-window sums on a flat float64 array; non-numeric cells count as NaN
+    flows = pd.to_numeric(df[adjusted_total_col].iloc[valid_rows], errors='coerce').to_numpy(dtype=np.float64)
+    stats['last_5_days_flow'], _ = tail_stats(flows, 5)
+    stats['last_20_days_flow'], _ = tail_stats(flows, 20)
+
+    if has_vwap:
+        # Calculate weighted average VWAP using Product column
+        # Weighted Average VWAP = Sum(Products) / Sum(Adjusted Totals)
+        if product_col and product_col in df.columns:
+            # Only rows with a Product value count, in both the numerator and the denominator
+            products = pd.to_numeric(df[product_col].iloc[valid_rows], errors='coerce').to_numpy(dtype=np.float64)
+            stats['last_5_days_vwap'] = weighted_tail_mean(products, flows, 5)
+            stats['last_20_days_vwap'] = weighted_tail_mean(products, flows, 20)
+        else:
+            # Fallback to simple average if Product column not found
+            vwaps = pd.to_numeric(df[vwap_col].iloc[valid_rows], errors='coerce').to_numpy(dtype=np.float64)
+            _, stats['last_5_days_vwap'] = tail_stats(vwaps, 5)
+            _, stats['last_20_days_vwap'] = tail_stats(vwaps, 20)
 
     # Find and update statistics table rows
-    # Look for cells containing "LAST DAY", "LAST 5 DAYS", "LAST 20 DAYS"
-    for idx, row in df.iterrows():
-        for col in df.columns:
-            cell_value = str(row[col]).strip() if pd.notna(row[col]) else ""
-
-            if cell_value == "LAST DAY":
-                # Find the flow and vwap columns (usually the next two columns)
-                col_idx = df.columns.get_loc(col)
-                if col_idx + 1 < len(df.columns) and 'last_day_flow' in stats:
-                    df.at[idx, df.columns[col_idx + 1]] = stats['last_day_flow']
-                if col_idx + 2 < len(df.columns) and 'last_day_vwap' in stats:
-                    df.at[idx, df.columns[col_idx + 2]] = stats['last_day_vwap']
-
-            elif cell_value == "LAST 5 DAYS":
-                col_idx = df.columns.get_loc(col)
-                if col_idx + 1 < len(df.columns) and 'last_5_days_flow' in stats:
-                    df.at[idx, df.columns[col_idx + 1]] = stats['last_5_days_flow']
-                if col_idx + 2 < len(df.columns) and 'last_5_days_vwap' in stats:
-                    df.at[idx, df.columns[col_idx + 2]] = stats['last_5_days_vwap']
-
-            elif cell_value == "LAST 20 DAYS":
-                col_idx = df.columns.get_loc(col)
-                if col_idx + 1 < len(df.columns) and 'last_20_days_flow' in stats:
-                    df.at[idx, df.columns[col_idx + 1]] = stats['last_20_days_flow']
-                if col_idx + 2 < len(df.columns) and 'last_20_days_vwap' in stats:
-                    df.at[idx, df.columns[col_idx + 2]] = stats['last_20_days_vwap']
+    # Look for cells containing the STATISTICS_ROWS labels in one pass over the
+    # object array; the flow and vwap values go in the next two columns
+    label_stats = dict(zip(STATISTICS_ROWS, (
+        ('last_day_flow', 'last_day_vwap'),
+        ('last_5_days_flow', 'last_5_days_vwap'),
+        ('last_20_days_flow', 'last_20_days_vwap'),
+    )))
+    cells = _strip_text_cells(df.to_numpy(dtype=object))
+    rows, cols = np.where(np.isin(cells, list(label_stats)))
+    num_cols = len(df.columns)
+
+    for row_pos, col_pos in zip(rows, cols):
+        flow_key, vwap_key = label_stats[cells[row_pos, col_pos]]
+        if col_pos + 1 < num_cols and flow_key in stats:
+            df.iat[row_pos, col_pos + 1] = stats[flow_key]
+        if col_pos + 2 < num_cols and vwap_key in stats:
+            df.iat[row_pos, col_pos + 2] = stats[vwap_key]
 
     print(f"[INFO] Updated statistics table for {sheet_name}")
     return df
 
 
-def process_file(job_config: Dict[str, Any], flow_map: Dict[str, float], target_date: str) -> None:
+def find_sheet_columns(columns: pd.Index, sheet_name: str, job_type: str) -> Dict[str, Any]:
     """
-    Process a single destination file and update it with new flow data.
+    Resolve the VWAP, Adjusted Total and Product columns of a sheet in a single pass.
+
+    - VWAP: first column with "vwap" (but not "product") in its name; otherwise a
+      column named after the sheet (for ticker sheets such as NVDA, GOOG, AAPL, PANW)
+    - Adjusted Total: last column containing "adjusted total"; simple sheets may
+      use their "Flow" column instead
+    - Product: first column with "product" in its name
+
+    Args:
+        columns: Column labels of the sheet
+        sheet_name: Name of the sheet
+        job_type: Job type ('complex' or 'simple')
+
+    Returns:
+        Dictionary with 'vwap_col', 'adjusted_total_col' and 'product_col' (None when absent)
+    """
+    # Normalize every column name once; all rules below work on these forms
+    names = [(col, str(col).lower()) for col in columns]
+    stripped_upper = [str(col).strip().upper() for col in columns]
+
+    vwap_col = next((col for col, lower in names if 'vwap' in lower and 'product' not in lower), None)
+    if vwap_col is None:
+        target = sheet_name.upper()
+        vwap_col = next((col for (col, _), upper in zip(names, stripped_upper) if upper == target), None)
+
+    adjusted_total_cols = [
+        col for col, lower in names
+        if 'adjusted total' in lower or (job_type == 'simple' and lower == 'flow')
+    ]
+
+    return {
+        'vwap_col': vwap_col,
+        'adjusted_total_col': adjusted_total_cols[-1] if adjusted_total_cols else None,
+        'product_col': next((col for col, lower in names if 'product' in lower), None),
+    }
+
+
+def coerce_numeric_columns(df: pd.DataFrame, columns: list) -> None:
+    """
+    Convert the given columns to float64 in place where that loses no data.
+
+    A column is only converted when every non-empty cell parses as a number, so
+    columns holding text (statistics labels, comma-decimal values) are left as is.
+
+    Args:
+        df: DataFrame to update
+        columns: Candidate column names; names not in df are ignored
+    """
+    for col in columns:
+        if col not in df.columns or df[col].dtype == np.float64:
+            continue
+        numeric = pd.to_numeric(df[col], errors='coerce')
+        if numeric.notna().sum() == df[col].notna().sum():
+            df[col] = numeric.astype(np.float64)
+
+
+def load_job_configs(jobs_file: Path) -> list:
+    """
+    Load the job configurations from a JSON file.
+
+    Each entry is a job dictionary with sheet_name and type, plus mapping
+    (complex jobs) or ticker and flow_column (simple jobs).
+
+    Args:
+        jobs_file: Path to the JSON job configuration file
+
+    Returns:
+        List of job configuration dictionaries
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not a JSON list of job objects, or two jobs
+            name the same sheet
+    """
+    with open(jobs_file, encoding='utf-8') as f:
+        jobs = json.load(f)
+
+    if not isinstance(jobs, list) or not all(isinstance(job, dict) for job in jobs):
+        raise ValueError("expected a JSON list of job objects")
+
+    # Jobs run in parallel on their own copy of a sheet, so two jobs on one sheet
+    # would overwrite each other's rows
+    seen = set()
+    for job in jobs:
+        sheet_name = job.get('sheet_name')
+        if sheet_name in seen:
+            raise ValueError(f"sheet '{sheet_name}' is used by more than one job")
+        seen.add(sheet_name)
+    return jobs
+
+
+def prepare_job_config(job_config: Dict[str, Any]) -> None:
+    """
+    Precompute per-job values that do not change between rows or runs.
+
+    For complex jobs this stores the mapped column names ('_cols') and their
+    leverage multipliers ('_mults'), so the multiplier regex runs once per
+    column at load time rather than on every row write.
+
+    Args:
+        job_config: Job configuration dictionary (updated in place)
+    """
+    if job_config.get('type') == 'complex':
+        mapping = job_config.get('mapping', {})
+        job_config['_cols'] = list(mapping.keys())
+        job_config['_mults'] = np.array(
+            [parse_multiplier_from_column_name(col) for col in mapping], dtype=np.float64
+        )
+
+
+def find_target_rows(all_sheets: Dict[str, pd.DataFrame], target_date: str) -> Dict[str, Optional[int]]:
+    """
+    Parse the Date column of every sheet and locate the row for the target date.
+
+    The Date column of each sheet is converted to datetime in place so that
+    process_file does not need to parse it again.
+
+    Args:
+        all_sheets: Dictionary mapping sheet names to DataFrames
+        target_date: Target date in YYYY-MM-DD format
+
+    Returns:
+        Dictionary mapping sheet names (with a Date column) to the index of the
+        first row for the target date, or None if no such row exists
+    """
+    day_start = pd.Timestamp(target_date).normalize()
+    day_end = day_start + pd.Timedelta(days=1)
+    target_rows = {}
+
+    for sheet_name, df in all_sheets.items():
+        if 'Date' not in df.columns:
+            continue
+
+        # Convert Date column to datetime with flexible parsing (handles DD.MM.YYYY, YYYY-MM-DD, etc.)
+        # dayfirst=True handles European date format like 17.11.2025. Columns stored as real
+        # Excel dates already load as datetime64 and need no parsing.
+        if not pd.api.types.is_datetime64_any_dtype(df['Date']):
+            df['Date'] = pd.to_datetime(df['Date'], errors='coerce', dayfirst=True)
+
+        # Match any time of day on the target date with a vectorized datetime64 range compare
+        dates = df['Date']
+        matches = df.index[(dates >= day_start) & (dates < day_end)]
+        target_rows[sheet_name] = matches[0] if len(matches) else None
+
+    return target_rows
+
+
+def process_file(job_config: Dict[str, Any], flow_map: pd.Series, target_date: str,
+                 all_sheets: Dict[str, pd.DataFrame], target_rows: Dict[str, Optional[int]]) -> Optional[str]:
+    """
+    Process a single destination sheet and update it with new flow data.
 
     This function implements the "upsert" logic:
     - If a row for the target date exists, UPDATE the flow values in place
     - If no row exists for the target date, APPEND a new row with the date and flow values
 
+    The sheet is taken from (and written back to) the in-memory all_sheets dict;
+    the changed cells are written to the workbook once by main() after all jobs have run.
+
     Args:
-        job_config: Configuration dictionary containing file_path, type, and mapping/ticker info
-        flow_map: Dictionary mapping ticker symbols to flow values
+        job_config: Configuration dictionary containing sheet_name, type, and mapping/ticker info
+        flow_map: Series mapping ticker symbols to flow values (float64)
         target_date: Target date in YYYY-MM-DD format (usually yesterday's date)
+        all_sheets: Dictionary mapping sheet names to DataFrames for the destination workbook
+        target_rows: Target-date row index per sheet, as returned by find_target_rows()
+
+    Returns:
+        Name of the sheet that was updated in all_sheets, or None if nothing was updated
 
     Raises:
-        FileNotFoundError: If the destination file doesn't exist
-        KeyError: If required columns are not found
+        KeyError: If the sheet or required columns are not found
     """
-    file_path = job_config['file_path']
+    sheet_name = job_config.get('sheet_name')
     job_type = job_config['type']
 
-    print(f"\n[INFO] Processing: {file_path}")
-
-    # Parse the file path to extract workbook name and sheet name
-    # Format: "Flows-2.xlsx - S&P 500 ETF.csv"
-    # We need to extract: workbook="Flows-2.xlsx", sheet="S&P 500 ETF"
-
-    if ' - ' in file_path:
-        parts = file_path.split(' - ', 1)
-        workbook_name = parts[0]
-        sheet_name = parts[1].replace('.csv', '').strip()
-    else:
-        print(f"[ERROR] Invalid file path format: {file_path}")
+    if not sheet_name:
+        print(f"[ERROR] Job has no sheet_name: {job_config}")
         return
 
-    if not Path(workbook_name).exists():
-        raise FileNotFoundError(f"Destination workbook not found: {workbook_name}")
+    print(f"\n[INFO] Processing: {sheet_name}")
+
+    if sheet_name not in all_sheets:
+        raise KeyError(f"Sheet '{sheet_name}' not found in destination workbook")
 
     try:
-        # Read the specific sheet from the workbook
-        df = pd.read_excel(workbook_name, sheet_name=sheet_name, engine='openpyxl')
+        # Work on a copy so a failed job leaves the cached sheet untouched
+        df = all_sheets[sheet_name].copy()
 
         # Check if 'Date' column exists
         if 'Date' not in df.columns:
             print(f"[ERROR] 'Date' column not found in sheet '{sheet_name}'")
             return
 
-        # Convert Date column to datetime with flexible parsing (handles DD.MM.YYYY, YYYY-MM-DD, etc.)
-        # dayfirst=True handles European date format like 17.11.2025
-        df['Date'] = pd.to_datetime(df['Date'], errors='coerce', dayfirst=True)
+        # Resolve the special columns once for this sheet
+        sheet_columns = find_sheet_columns(df.columns, sheet_name, job_type)
+        vwap_col = sheet_columns['vwap_col']
+        adjusted_total_col = sheet_columns['adjusted_total_col']
+        product_col = sheet_columns['product_col']
+
+        # Work on float64 buffers for the flow/VWAP columns so writes and reductions stay numeric
+        if job_type == 'complex':
+            value_cols = list(job_config.get('_cols') or job_config.get('mapping', {}))
+        else:
+            value_cols = [job_config.get('flow_column')]
+        coerce_numeric_columns(df, value_cols + [vwap_col, adjusted_total_col, product_col])
 
         # Convert target_date to datetime
-        target_date_dt = pd.to_datetime(target_date)
+        target_date_dt = pd.to_datetime(target_date, format='%Y-%m-%d')
 
-        # Check if a row for the target date already exists (comparing datetime, will match regardless of time)
-        # Normalize both to date only for comparison
-        existing_row_mask = df['Date'].dt.date == target_date_dt.date()
-        row_exists = existing_row_mask.any()
+        # Row for the target date, if it already exists (precomputed by find_target_rows)
+        row_idx = target_rows.get(sheet_name)
+        row_exists = row_idx is not None
 
         if job_type == 'complex':
             # Complex type: Multiple columns to update based on mapping
             mapping = job_config.get('mapping', {})
 
             if not mapping:
-                print(f"[ERROR] No mapping found for complex job: {file_path}")
+                print(f"[ERROR] No mapping found for complex job: {sheet_name}")
                 return
 
-            updates_made = 0
+            if '_mults' not in job_config:
+                prepare_job_config(job_config)
 
             if row_exists:
                 # UPDATE existing row
                 print(f"[INFO] Updating existing row for date: {target_date}")
-                row_idx = df[existing_row_mask].index[0]
+            else:
+                # APPEND new row
+                print(f"[INFO] Appending new row for date: {target_date}")
 
-                for column_name, ticker in mapping.items():
-                    if column_name not in df.columns:
-                        print(f"[WARNING] Column '{column_name}' not found in sheet, skipping...")
-                        continue
+            # Keep only the mapped columns present in the sheet
+            present = np.array([col in df.columns for col in job_config['_cols']], dtype=bool)
+            for column_name, keep in zip(job_config['_cols'], present):
+                if not keep:
+                    print(f"[WARNING] Column '{column_name}' not found in sheet, skipping...")
+
+            cols = [col for col, keep in zip(job_config['_cols'], present) if keep]
+            tickers = [mapping[col] for col in cols]
+
+            found = pd.Index(tickers).isin(flow_map.index)
+            for ticker, is_found in zip(tickers, found):
+                if not is_found:
+                    print(f"[WARNING] Ticker '{ticker}' not found in flow map, using 0.0")
+            updates_made = int(found.sum())
 
-                    if ticker in flow_map:
-                        # Get raw value and multiply by leverage factor
-                        raw_value = flow_map[ticker]
-                        multiplier = parse_multiplier_from_column_name(column_name)
-                        multiplied_value = raw_value * multiplier
-                        df.at[row_idx, column_name] = multiplied_value
-                        updates_made += 1
-                    else:
-                        print(f"[WARNING] Ticker '{ticker}' not found in flow map, using 0.0")
-                        df.at[row_idx, column_name] = 0.0
+            # Resolve all tickers with one reindex and apply the leverage multipliers
+            raw_values = flow_map.reindex(tickers, fill_value=0.0).to_numpy(dtype=np.float64)
+            values = raw_values * job_config['_mults'][present]
 
+            if row_exists:
+                # Assign all mapped columns of the row in one call
+                if cols:
+                    df.loc[row_idx, cols] = values
                 print(f"[INFO] Updated {updates_made} column(s)")
             else:
-                # APPEND new row
-                print(f"[INFO] Appending new row for date: {target_date}")
-
-                # Create a new row with all columns set to pd.NA initially
-                new_row = {col: pd.NA for col in df.columns}
-                new_row['Date'] = target_date_dt
-
-                # Fill in the mapped columns
-                for column_name, ticker in mapping.items():
-                    if column_name in df.columns:
-                        if ticker in flow_map:
-                            # Get raw value and multiply by leverage factor
-                            raw_value = flow_map[ticker]
-                            multiplier = parse_multiplier_from_column_name(column_name)
-                            multiplied_value = raw_value * multiplier
-                            new_row[column_name] = multiplied_value
-                            updates_made += 1
-                        else:
-                            print(f"[WARNING] Ticker '{ticker}' not found in flow map, using 0.0")
-                            new_row[column_name] = 0.0
-
-                # Append the new row using loc to avoid FutureWarning
-                df.loc[len(df)] = new_row
+                # Append a single row holding only the touched columns; concat fills the rest with NaN
+                new_row = pd.DataFrame([{'Date': target_date_dt, **dict(zip(cols, values))}])
+                df = pd.concat([df, new_row], ignore_index=True)
+                row_idx = len(df) - 1
                 print(f"[INFO] Appended row with {updates_made} value(s)")
 
         elif job_type == 'simple':
@@ -589,7 +951,7 @@ def process_file(job_config: Dict[str, Any], flow_map: Dict[str, float], target_
             flow_column = job_config.get('flow_column')
 
             if not ticker or not flow_column:
-                print(f"[ERROR] Missing ticker or flow_column for simple job: {file_path}")
+                print(f"[ERROR] Missing ticker or flow_column for simple job: {sheet_name}")
                 return
 
             if flow_column not in df.columns:
@@ -603,25 +965,21 @@ def process_file(job_config: Dict[str, Any], flow_map: Dict[str, float], target_
 
             # Apply multiplier to the value before storing
             multiplier = parse_multiplier_from_column_name(flow_column)
-            flow_value = raw_value * multiplier
+            flow_value = float(raw_value) * multiplier
 
             if row_exists:
                 # UPDATE existing row
                 print(f"[INFO] Updating existing row for date: {target_date}")
-                row_idx = df[existing_row_mask].index[0]
                 df.at[row_idx, flow_column] = flow_value
                 print(f"[INFO] Updated column '{flow_column}' with value: {flow_value}")
             else:
                 # APPEND new row
                 print(f"[INFO] Appending new row for date: {target_date}")
 
-                # Create a new row with all columns set to pd.NA initially
-                new_row = {col: pd.NA for col in df.columns}
-                new_row['Date'] = target_date_dt
-                new_row[flow_column] = flow_value
-
-                # Append the new row using loc to avoid FutureWarning
-                df.loc[len(df)] = new_row
+                # Append a single row holding only the touched columns; concat fills the rest with NaN
+                new_row = pd.DataFrame([{'Date': target_date_dt, flow_column: flow_value}])
+                df = pd.concat([df, new_row], ignore_index=True)
+                row_idx = len(df) - 1
                 print(f"[INFO] Appended row with value: {flow_value}")
 
         else:
@@ -629,69 +987,24 @@ def process_file(job_config: Dict[str, Any], flow_map: Dict[str, float], target_
             return
 
         # Fetch and fill VWAP value for this date
-        # Find VWAP column
-        # First try to find column with "vwap" in name
-        # If not found, try to find column matching sheet name (for NVDA, GOOG, AAPL, PANW, etc.)
-        vwap_col = None
-        for col in df.columns:
-            # Find VWAP column but exclude Product column
-            if 'vwap' in str(col).lower() and 'product' not in str(col).lower():
-                vwap_col = col
-                break
-
-        # If not found, check if column name matches sheet name (for ticker-specific sheets)
-        if not vwap_col:
-            for col in df.columns:
-                if str(col).strip().upper() == sheet_name.upper():
-                    vwap_col = col
-                    break
-
         if vwap_col:
             # Get the ticker for VWAP
             vwap_ticker = get_vwap_ticker_for_sheet(sheet_name)
             if vwap_ticker:
                 vwap_value = fetch_vwap_for_date(vwap_ticker, target_date)
                 if vwap_value is not None:
-                    if row_exists:
-                        row_idx = df[existing_row_mask].index[0]
-                    else:
-                        row_idx = len(df) - 1  # The newly appended row
-
                     df.at[row_idx, vwap_col] = vwap_value
                     print(f"[INFO] Set {vwap_col} = {vwap_value} (from {vwap_ticker})")
 
         # Calculate and fill Adjusted Total Flow for the current row
-        # Find the Adjusted Total Flow column (could be named differently per sheet)
-        adjusted_total_col = None
-
-        for col in df.columns:
-            if 'adjusted total' in str(col).lower() or (job_type == 'simple' and str(col).lower() == 'flow'):
-                adjusted_total_col = col
-
         if adjusted_total_col:
-            if row_exists:
-                row_idx = df[existing_row_mask].index[0]
-            else:
-                row_idx = len(df) - 1  # The newly appended row
-
             # Calculate the adjusted total flow for this row
             adjusted_total_value = calculate_adjusted_total_flow(df, row_idx, job_config)
             df.at[row_idx, adjusted_total_col] = adjusted_total_value
             print(f"[INFO] Set {adjusted_total_col} = {adjusted_total_value}")
 
         # Calculate and fill Product column (VWAP × Adjusted Total)
-        product_col = None
-        for col in df.columns:
-            if 'product' in str(col).lower():
-                product_col = col
-                break
-
         if product_col and vwap_col and adjusted_total_col:
-            if row_exists:
-                row_idx = df[existing_row_mask].index[0]
-            else:
-                row_idx = len(df) - 1  # The newly appended row
-
             # Get VWAP and Adjusted Total values
             vwap_value = df.at[row_idx, vwap_col]
             adjusted_total_value = df.at[row_idx, adjusted_total_col]
@@ -703,22 +1016,10 @@ def process_file(job_config: Dict[str, Any], flow_map: Dict[str, float], target_
                 print(f"[INFO] Set {product_col} = {product_value}")
 
         # Update statistics table (LAST DAY, LAST 5 DAYS, LAST 20 DAYS)
-        # Re-find vwap_col for statistics update (same logic as above)
-        vwap_col_for_stats = None
-        for col in df.columns:
-            if 'vwap' in str(col).lower() and 'product' not in str(col).lower():
-                vwap_col_for_stats = col
-                break
-
-        # If not found, check if column name matches sheet name (for ticker-specific sheets)
-        if not vwap_col_for_stats:
-            for col in df.columns:
-                if str(col).strip().upper() == sheet_name.upper():
-                    vwap_col_for_stats = col
-                    break
-
         if adjusted_total_col:
-            df = update_statistics_table(df, sheet_name, adjusted_total_col, vwap_col_for_stats)
+            last_vwap = df.at[row_idx, vwap_col] if vwap_col else None
+            df = update_statistics_table(df, sheet_name, adjusted_total_col, vwap_col, product_col,
+                                         precomputed_last=(row_idx, adjusted_total_value, last_vwap))
 
         # Sheets that should not be edited at all
         skip_edit_sheets = ['DIN', 'TR', 'BOFA']
@@ -727,124 +1028,263 @@ def process_file(job_config: Dict[str, Any], flow_map: Dict[str, float], target_
             print(f"[INFO] Skipping edit for {sheet_name} (in skip list)")
             return
 
-        # Convert Date column to string format "DD MMM YYYY" (e.g., "17 Nov 2025")
-        if 'Date' in df.columns:
-            df['Date'] = pd.to_datetime(df['Date'], errors='coerce').dt.strftime('%d %b %Y')
-
-        # Save the updated DataFrame back to the Excel sheet
-        # We need to read all sheets, update the specific one, and write back
-        with pd.ExcelFile(workbook_name, engine='openpyxl') as xls:
-            all_sheets = {sheet: pd.read_excel(xls, sheet_name=sheet) for sheet in xls.sheet_names}
-
         # Update the specific sheet with our modified df (includes statistics tables)
         all_sheets[sheet_name] = df
 
-        # Write all sheets back to the workbook
-        with pd.ExcelWriter(workbook_name, engine='openpyxl', mode='w') as writer:
-            for sheet, data in all_sheets.items():
-                data.to_excel(writer, sheet_name=sheet, index=False)
-
-        print(f"[SUCCESS] Saved changes to: {workbook_name} (sheet: {sheet_name})")
+        print(f"[SUCCESS] Updated sheet: {sheet_name}")
+        return sheet_name
 
     except Exception as e:
         print(f"[ERROR] Failed to process file: {str(e)}")
         raise
 
 
-def format_statistics_table_in_sheet(workbook_path: str, sheet_name: str) -> None:
+def _same_cell_value(old: Any, new: Any) -> bool:
+    """Whether a cell already holds value new; numbers only need to agree to floating-point noise."""
+    if isinstance(old, (int, float)) and isinstance(new, (int, float)) \
+            and not isinstance(old, bool) and not isinstance(new, bool):
+        return math.isclose(old, new, rel_tol=1e-12, abs_tol=1e-12)
+    return old == new
+
+
+def write_sheet_updates(ws, df: pd.DataFrame) -> int:
+    """
+    Write the cells of a worksheet whose value differs from the DataFrame.
+
+    DataFrame row i maps to worksheet row i + 2 (row 1 is the header, which is
+    left alone). Formula cells are replaced by the value read for them, exactly
+    as a full rewrite would, so the next run still reads plain numbers. Cells of
+    a row appended past the end of the worksheet take their style from the last
+    row that has a date, never from the statistics tables below the data.
+
+    Args:
+        ws: openpyxl worksheet to update in place
+        df: Updated sheet contents
+
+    Returns:
+        Number of cells written
+    """
+    date_col = df.columns.get_loc('Date') + 1 if 'Date' in df.columns else None
+    last_row = ws.max_row
+    written = 0
+
+    # Style source for appended rows: the last dated row of the existing sheet
+    style_row = None
+    if date_col is not None:
+        style_row = next((r for r in range(last_row, 1, -1)
+                          if ws.cell(row=r, column=date_col).value is not None), None)
+
+    for row_num, row in enumerate(df.itertuples(index=False, name=None), start=2):
+        new_row = style_row is not None and row_num > last_row
+
+        for col_num, value in enumerate(row, start=1):
+            if pd.isna(value):
+                continue
+            if isinstance(value, pd.Timestamp):
+                value = value.to_pydatetime()
+            elif isinstance(value, np.generic):
+                value = value.item()
+
+            cell = ws.cell(row=row_num, column=col_num)
+            if _same_cell_value(cell.value, value):
+                continue
+
+            if new_row and not cell.has_style:
+                cell._style = copy(ws.cell(row=style_row, column=col_num)._style)
+            cell.value = value
+            written += 1
+
+    return written
+
+
+def write_workbook_updates(wb, all_sheets: Dict[str, pd.DataFrame], sheet_names: list) -> int:
+    """
+    Write the updated sheets into the loaded destination workbook in place.
+
+    Only cells that changed are written, so formatting (and formulas on sheets no
+    job touched) survive the save.
+
+    Args:
+        wb: Destination workbook loaded with openpyxl
+        all_sheets: Dictionary mapping sheet names to DataFrames
+        sheet_names: Names of the sheets updated by the jobs
+
+    Returns:
+        Total number of cells written
+    """
+    total_written = 0
+
+    for sheet_name in sheet_names:
+        written = write_sheet_updates(wb[sheet_name], all_sheets[sheet_name])
+        total_written += written
+        print(f"[INFO] Wrote {written} cell(s) to sheet: {sheet_name}")
+
+    return total_written
+
+
+def format_statistics_table_in_sheet(wb, sheet_name: str) -> None:
     """
     Apply formatting to the statistics table in an individual sheet to match ALL sheet style.
 
+    The workbook is modified in memory; the caller saves it.
+
     Args:
-        workbook_path: Path to the Excel workbook
+        wb: Destination workbook loaded with openpyxl
         sheet_name: Name of the sheet to format
     """
-    from openpyxl import load_workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-
     try:
-        wb = load_workbook(workbook_path)
-
         if sheet_name not in wb.sheetnames:
             return
 
         ws = wb[sheet_name]
 
-        # Define styles matching ALL sheet
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-
-        label_font = Font(bold=True, italic=True, size=10)
-        header_font = Font(italic=True, size=10)
-        center_align = Alignment(horizontal="center", vertical="center")
-        right_align = Alignment(horizontal="right", vertical="center")
-
-        green_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-        red_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-
         # Find and format statistics rows
-        statistics_labels = ["LAST DAY", "LAST 5 DAYS", "LAST 20 DAYS"]
-
-        for row_idx in range(1, ws.max_row + 1):
-            for col_idx in range(1, ws.max_column + 1):
-                cell = ws.cell(row=row_idx, column=col_idx)
+        for row in ws.iter_rows():
+            for col_pos, cell in enumerate(row):
                 cell_value = str(cell.value).strip() if cell.value else ""
 
                 # Format statistics labels
-                if cell_value in statistics_labels:
+                if cell_value in STATISTICS_LABELS:
                     # Format the label cell
-                    cell.font = label_font
-                    cell.alignment = center_align
-                    cell.border = thin_border
+                    cell.font = LABEL_FONT
+                    cell.alignment = CENTER_ALIGN
+                    cell.border = THIN_BORDER
 
                     # Format the flow value (next column)
-                    flow_cell = ws.cell(row=row_idx, column=col_idx + 1)
-                    if flow_cell.value is not None and flow_cell.value != '':
+                    flow_cell = row[col_pos + 1] if col_pos + 1 < len(row) else None
+                    if flow_cell is not None and flow_cell.value is not None and flow_cell.value != '':
+                        flow_cell.alignment = RIGHT_ALIGN
+                        flow_cell.border = THIN_BORDER
+                        # Only numeric flows get the number format and fill
                         try:
                             flow_val = float(flow_cell.value)
-                            flow_cell.alignment = right_align
-                            flow_cell.border = thin_border
-                            flow_cell.number_format = '#,##0.00'
+                        except (ValueError, TypeError):
+                            flow_val = None
+                        if flow_val is not None:
+                            flow_cell.number_format = NUMFMT
                             # Apply conditional formatting (no color for 0)
                             if flow_val != 0:
-                                flow_cell.fill = green_fill if flow_val > 0 else red_fill
-                        except (ValueError, TypeError):
-                            flow_cell.alignment = right_align
-                            flow_cell.border = thin_border
+                                flow_cell.fill = FILLS[flow_val > 0]
 
                     # Format VWAP/Average cell (next next column)
-                    vwap_cell = ws.cell(row=row_idx, column=col_idx + 2)
-                    if vwap_cell.value is not None and vwap_cell.value != '':
-                        try:
-                            vwap_cell.alignment = right_align
-                            vwap_cell.border = thin_border
-                            vwap_cell.number_format = '#,##0.00'
-                        except:
-                            pass
+                    vwap_cell = row[col_pos + 2] if col_pos + 2 < len(row) else None
+                    if vwap_cell is not None and vwap_cell.value is not None and vwap_cell.value != '':
+                        vwap_cell.alignment = RIGHT_ALIGN
+                        vwap_cell.border = THIN_BORDER
+                        vwap_cell.number_format = NUMFMT
 
-        wb.save(workbook_path)
         print(f"[INFO] Applied table formatting to {sheet_name}")
 
     except Exception as e:
         print(f"[WARNING] Could not format statistics table in {sheet_name}: {str(e)}")
 
 
-def create_all_statistics_sheet(workbook_path: str, sheet_names: list) -> None:
+def _style_template(ws, font=None, alignment=None, border=None, fill=None, number_format=None):
+    """
+    Build the style array for one kind of cell by styling a detached cell once.
+
+    Cells given a copy of the returned array (cell._style = copy(template)) get
+    every style attribute in a single assignment.
+    """
+    template = Cell(ws)
+    if font is not None:
+        template.font = font
+    if alignment is not None:
+        template.alignment = alignment
+    if border is not None:
+        template.border = border
+    if fill is not None:
+        template.fill = fill
+    if number_format is not None:
+        template.number_format = number_format
+    return template._style
+
+
+# ALL dashboard statistics keys per label: (flow key, vwap key)
+_DASHBOARD_LABEL_KEYS = dict(zip(STATISTICS_ROWS, (
+    ('last_day_flow', 'last_day_vwap'),
+    ('last_5_flow', 'last_5_vwap'),
+    ('last_20_flow', 'last_20_vwap'),
+)))
+
+# One ALL dashboard table, cell by cell: (row offset, column offset, content, kind).
+# For 'ticker', 'flow' and 'vwap' cells the content is a key into the ticker's
+# statistics; 'header' and 'label' cells hold the content text itself.
+_DASHBOARD_LAYOUT = (
+    (0, 0, 'ticker', 'ticker'), (0, 1, "FLOW", 'header'), (0, 2, "AVERAGE", 'header'),
+) + tuple(
+    cell
+    for row_offset, (label, (flow_key, vwap_key)) in enumerate(_DASHBOARD_LABEL_KEYS.items(), 1)
+    for cell in ((row_offset, 0, label, 'label'), (row_offset, 1, flow_key, 'flow'),
+                 (row_offset, 2, vwap_key, 'vwap'))
+)
+
+# Dashboard style kind of a non-zero flow, indexed by flow_val > 0
+_FLOW_STYLE_KINDS = ('outflow', 'inflow')
+
+
+def _statistic_style_kind(value: Any, signed: bool) -> str:
+    """Style kind of a dashboard value cell: empty, a plain number, or (for flows) an inflow/outflow."""
+    if value is None:
+        return 'empty'
+    if signed:
+        flow_val = float(value)
+        if flow_val != 0:
+            return _FLOW_STYLE_KINDS[flow_val > 0]
+    return 'number'
+
+
+def _saved_cell_value(value: Any) -> Any:
+    """Value a cell reads back as after an openpyxl save: formulas keep no cached result, so they read as None."""
+    return None if isinstance(value, str) and value.startswith('=') else value
+
+
+def _collect_sheet_statistics(ws, min_row: int, label_keys: Dict[str, Tuple[str, str]],
+                              stats_data: Dict[str, Any]) -> set:
+    """
+    Copy the values beside each statistics label from min_row down into stats_data.
+
+    All labels are matched in one vectorized pass; np.where is row-major, so a
+    later label overrides an earlier one.
+
+    Args:
+        ws: Worksheet to scan
+        min_row: First worksheet row to scan
+        label_keys: Label -> (flow key, vwap key) in stats_data
+        stats_data: Statistics dictionary, updated in place
+
+    Returns:
+        Set of the labels found
+    """
+    cells = np.array(list(ws.iter_rows(min_row=min_row, values_only=True)), dtype=object)
+    if cells.ndim != 2:
+        return set()
+
+    labels = _strip_text_cells(cells)
+    rows, cols = np.where(np.isin(labels, list(label_keys)))
+    num_cols = cells.shape[1]
+
+    for row_pos, col_pos in zip(rows, cols):
+        flow_key, vwap_key = label_keys[labels[row_pos, col_pos]]
+        if col_pos + 1 < num_cols:
+            stats_data[flow_key] = _saved_cell_value(cells[row_pos, col_pos + 1])
+        if col_pos + 2 < num_cols:
+            stats_data[vwap_key] = _saved_cell_value(cells[row_pos, col_pos + 2])
+
+    return set(labels[rows, cols])
+
+
+def create_all_statistics_sheet(wb, sheet_names: list) -> None:
     """
     Create an 'ALL' sheet with statistics dashboard for all tickers in grid layout.
 
+    Statistics are read from, and the dashboard written to, the workbook in
+    memory; the caller saves it.
+
     Args:
-        workbook_path: Path to the Excel workbook
+        wb: Destination workbook loaded with openpyxl, with the job updates written
         sheet_names: List of sheet names to collect statistics from
     """
-    from openpyxl import load_workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.utils import get_column_letter
-
     print(f"\n[INFO] Creating ALL statistics dashboard...")
 
     # Read all sheets to collect statistics
@@ -859,83 +1299,83 @@ def create_all_statistics_sheet(workbook_path: str, sheet_names: list) -> None:
         'Natural Gas', 'Palladium ETF', 'Platinum ETF', 'Copper ETF'
     ]
 
-    with pd.ExcelFile(workbook_path, engine='openpyxl') as xls:
-        for sheet_name in ordered_sheets:
-            # Skip if sheet doesn't exist in workbook
-            if sheet_name not in xls.sheet_names:
-                continue
+    # Stat keys filled from the two cells to the right of each label
+    label_keys = _DASHBOARD_LABEL_KEYS
 
-            try:
-                df = pd.read_excel(xls, sheet_name=sheet_name)
-
-                # Don't skip sheets without Date column - they might still have statistics
-                stats_data = {
-                    'ticker': sheet_name,
-                    'last_day_flow': None,
-                    'last_day_vwap': None,
-                    'last_5_flow': None,
-                    'last_5_vwap': None,
-                    'last_20_flow': None,
-                    'last_20_vwap': None
-                }
-
-                for idx, row in df.iterrows():
-                    for col in df.columns:
-                        cell_value = str(row[col]).strip() if pd.notna(row[col]) else ""
-                        col_idx = df.columns.get_loc(col)
-
-                        if cell_value == "LAST DAY":
-                            if col_idx + 1 < len(df.columns):
-                                stats_data['last_day_flow'] = row[df.columns[col_idx + 1]]
-                            if col_idx + 2 < len(df.columns):
-                                stats_data['last_day_vwap'] = row[df.columns[col_idx + 2]]
-
-                        elif cell_value == "LAST 5 DAYS":
-                            if col_idx + 1 < len(df.columns):
-                                stats_data['last_5_flow'] = row[df.columns[col_idx + 1]]
-                            if col_idx + 2 < len(df.columns):
-                                stats_data['last_5_vwap'] = row[df.columns[col_idx + 2]]
-
-                        elif cell_value == "LAST 20 DAYS":
-                            if col_idx + 1 < len(df.columns):
-                                stats_data['last_20_flow'] = row[df.columns[col_idx + 1]]
-                            if col_idx + 2 < len(df.columns):
-                                stats_data['last_20_vwap'] = row[df.columns[col_idx + 2]]
-
-                all_stats.append(stats_data)
+    for sheet_name in ordered_sheets:
+        # Skip if sheet doesn't exist in workbook
+        if sheet_name not in wb.sheetnames:
+            continue
 
-            except Exception as e:
-                print(f"[WARNING] Could not read statistics from {sheet_name}: {str(e)}")
-                continue
+        try:
+            ws = wb[sheet_name]
+
+            # Don't skip sheets without Date column - they might still have statistics
+            stats_data = {
+                'ticker': sheet_name,
+                'last_day_flow': None,
+                'last_day_vwap': None,
+                'last_5_flow': None,
+                'last_5_vwap': None,
+                'last_20_flow': None,
+                'last_20_vwap': None
+            }
+
+            # The statistics tables sit at the bottom of each sheet and the last
+            # occurrence of a label wins, so when the closing rows hold all three
+            # labels they give the same values as a scan of the whole sheet
+            # (row 1 is the column header row)
+            window_start = max(2, ws.max_row - STATS_SCAN_ROWS + 1)
+            seen = _collect_sheet_statistics(ws, window_start, label_keys, stats_data)
+            if len(seen) < len(label_keys) and window_start > 2:
+                _collect_sheet_statistics(ws, 2, label_keys, stats_data)
+
+            all_stats.append(stats_data)
+
+        except Exception as e:
+            print(f"[WARNING] Could not read statistics from {sheet_name}: {str(e)}")
+            continue
 
     if not all_stats:
         print("[WARNING] No statistics found to create ALL sheet")
         return
 
-    # Create workbook and ALL sheet
-    wb = load_workbook(workbook_path)
+    # Build the new dashboard beside the old one so a failure leaves the workbook as it was
+    ws = wb.create_sheet('ALL', 0)
+    try:
+        _write_statistics_grid(ws, all_stats)
+    except Exception:
+        wb.remove(ws)
+        raise
 
-    if 'ALL' in wb.sheetnames:
-        del wb['ALL']
+    if ws.title != 'ALL':
+        wb.remove(wb['ALL'])
+        ws.title = 'ALL'
 
-    ws = wb.create_sheet('ALL', 0)
+    print(f"[SUCCESS] Created ALL statistics dashboard with {len(all_stats)} ticker(s)")
 
-    # Define styles
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
 
-    ticker_font = Font(bold=True, italic=True, color="FF0000", size=11)  # Red italic
-    header_font = Font(italic=True, bold=False, size=10)
-    label_font = Font(bold=True, italic=True, size=10)
-    center_align = Alignment(horizontal="center", vertical="center")
-    right_align = Alignment(horizontal="right", vertical="center")
+def _write_statistics_grid(ws, all_stats: list) -> None:
+    """
+    Write the dashboard tables into an empty worksheet, four tables per row.
 
-    green_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-    red_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+    Args:
+        ws: Worksheet to fill
+        all_stats: Statistics dictionaries, one per ticker, in display order
+    """
+    # Style each kind of cell once; every grid cell then takes a copy of its
+    # kind's style array instead of setting font, alignment, border, ... one by one
+    cell_styles = {
+        'ticker': _style_template(ws, font=TICKER_FONT, alignment=CENTER_ALIGN, border=THIN_BORDER),
+        'header': _style_template(ws, font=HEADER_FONT, alignment=CENTER_ALIGN, border=THIN_BORDER),
+        'label': _style_template(ws, font=LABEL_FONT, alignment=CENTER_ALIGN, border=THIN_BORDER),
+        'empty': _style_template(ws, alignment=RIGHT_ALIGN, border=THIN_BORDER),
+        'number': _style_template(ws, alignment=RIGHT_ALIGN, border=THIN_BORDER, number_format=NUMFMT),
+        'inflow': _style_template(ws, alignment=RIGHT_ALIGN, border=THIN_BORDER, fill=GREEN_FILL,
+                                  number_format=NUMFMT),
+        'outflow': _style_template(ws, alignment=RIGHT_ALIGN, border=THIN_BORDER, fill=RED_FILL,
+                                   number_format=NUMFMT),
+    }
 
     # Grid layout: 4 columns of tables
     tables_per_row = 4
@@ -944,99 +1384,29 @@ def create_all_statistics_sheet(workbook_path: str, sheet_names: list) -> None:
     col_spacing = 1  # space between tables
     row_spacing = 1  # space between table rows
 
-    for idx, stats in enumerate(all_stats):
-        # Calculate position in grid
-        grid_col = idx % tables_per_row
-        grid_row = idx // tables_per_row
-
-        # Starting cell position
-        start_col = 1 + grid_col * (table_width + col_spacing)
-        start_row = 1 + grid_row * (table_height + row_spacing)
-
-        # Row 1: Ticker name and headers
-        # Cell A: Ticker name
-        cell = ws.cell(row=start_row, column=start_col)
-        cell.value = stats['ticker']
-        cell.font = ticker_font
-        cell.alignment = center_align
-        cell.border = thin_border
-
-        # Cell B: "FLOW" header
-        cell = ws.cell(row=start_row, column=start_col + 1)
-        cell.value = "FLOW"
-        cell.font = header_font
-        cell.alignment = center_align
-        cell.border = thin_border
-
-        # Cell C: "AVERAGE" header
-        cell = ws.cell(row=start_row, column=start_col + 2)
-        cell.value = "AVERAGE"
-        cell.font = header_font
-        cell.alignment = center_align
-        cell.border = thin_border
-
-        # Row 2: LAST DAY
-        cell = ws.cell(row=start_row + 1, column=start_col)
-        cell.value = "LAST DAY"
-        cell.font = label_font
-        cell.alignment = center_align
-        cell.border = thin_border
-
-        cell = ws.cell(row=start_row + 1, column=start_col + 1)
-        cell.value = stats['last_day_flow']
-        cell.alignment = right_align
-        cell.border = thin_border
-        cell.number_format = '#,##0.00' if cell.value else ''
-        if cell.value is not None and float(cell.value) != 0:
-            cell.fill = green_fill if float(cell.value) > 0 else red_fill
-
-        cell = ws.cell(row=start_row + 1, column=start_col + 2)
-        cell.value = stats['last_day_vwap']
-        cell.alignment = right_align
-        cell.border = thin_border
-        cell.number_format = '#,##0.00' if cell.value else ''
-
-        # Row 3: LAST 5 DAYS
-        cell = ws.cell(row=start_row + 2, column=start_col)
-        cell.value = "LAST 5 DAYS"
-        cell.font = label_font
-        cell.alignment = center_align
-        cell.border = thin_border
-
-        cell = ws.cell(row=start_row + 2, column=start_col + 1)
-        cell.value = stats['last_5_flow']
-        cell.alignment = right_align
-        cell.border = thin_border
-        cell.number_format = '#,##0.00' if cell.value else ''
-        if cell.value is not None and float(cell.value) != 0:
-            cell.fill = green_fill if float(cell.value) > 0 else red_fill
-
-        cell = ws.cell(row=start_row + 2, column=start_col + 2)
-        cell.value = stats['last_5_vwap']
-        cell.alignment = right_align
-        cell.border = thin_border
-        cell.number_format = '#,##0.00' if cell.value else ''
-
-        # Row 4: LAST 20 DAYS
-        cell = ws.cell(row=start_row + 3, column=start_col)
-        cell.value = "LAST 20 DAYS"
-        cell.font = label_font
-        cell.alignment = center_align
-        cell.border = thin_border
-
-        cell = ws.cell(row=start_row + 3, column=start_col + 1)
-        cell.value = stats['last_20_flow']
-        cell.alignment = right_align
-        cell.border = thin_border
-        cell.number_format = '#,##0.00' if cell.value else ''
-        if cell.value is not None and float(cell.value) != 0:
-            cell.fill = green_fill if float(cell.value) > 0 else red_fill
-
-        cell = ws.cell(row=start_row + 3, column=start_col + 2)
-        cell.value = stats['last_20_vwap']
-        cell.alignment = right_align
-        cell.border = thin_border
-        cell.number_format = '#,##0.00' if cell.value else ''
+    # Build the sheet a worksheet row at a time: each row of the grid is
+    # table_height rows with up to tables_per_row tables side by side, followed
+    # by row_spacing empty rows. Cells are created already styled and appended.
+    for first in range(0, len(all_stats), tables_per_row):
+        group = all_stats[first:first + tables_per_row]
+        row_width = len(group) * (table_width + col_spacing) - col_spacing
+
+        for table_row in range(table_height):
+            row_cells = [None] * row_width
+            for slot, stats in enumerate(group):
+                for row_offset, col_offset, content, kind in _DASHBOARD_LAYOUT:
+                    if row_offset != table_row:
+                        continue
+                    value = stats[content] if kind in ('ticker', 'flow', 'vwap') else content
+                    cell = Cell(ws, value=value)
+                    if kind in ('flow', 'vwap'):
+                        kind = _statistic_style_kind(cell.value, signed=kind == 'flow')
+                    cell._style = copy(cell_styles[kind])
+                    row_cells[slot * (table_width + col_spacing) + col_offset] = cell
+            ws.append(row_cells)
+
+        for _ in range(row_spacing):
+            ws.append([])
 
     # Set column widths
     for col in range(1, tables_per_row * (table_width + col_spacing) + 1):
@@ -1047,8 +1417,64 @@ def create_all_statistics_sheet(workbook_path: str, sheet_names: list) -> None:
         elif col % (table_width + col_spacing) == 3:  # Average column
             ws.column_dimensions[get_column_letter(col)].width = 12
 
-    wb.save(workbook_path)
-    print(f"[SUCCESS] Created ALL statistics dashboard with {len(all_stats)} ticker(s)")
+
+class ThreadOutputRouter:
+    """
+    File-like replacement for sys.stdout that gives each worker thread its own buffer.
+
+    Worker threads call start_capture()/stop_capture() around a job so that the
+    job's console output can be printed as one contiguous block; writes from
+    any other thread pass straight through to the wrapped stream.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def start_capture(self) -> None:
+        self._local.buffer = io.StringIO()
+
+    def stop_capture(self) -> str:
+        buffer = self._local.__dict__.pop('buffer', None)
+        return buffer.getvalue() if buffer is not None else ''
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer if buffer is not None else self.stream).write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+def run_job(job_config: Dict[str, Any], flow_map: pd.Series, target_date: str,
+            all_sheets: Dict[str, pd.DataFrame], target_rows: Dict[str, Optional[int]],
+            router: ThreadOutputRouter) -> Tuple[bool, Optional[str], str]:
+    """
+    Run process_file for a single job in a worker thread.
+
+    Each job only reads and replaces its own entry in all_sheets, so jobs can
+    run concurrently without locking.
+
+    Args:
+        job_config: Job configuration dictionary
+        flow_map: Series mapping ticker symbols to flow values
+        target_date: Target date in YYYY-MM-DD format
+        all_sheets: Dictionary mapping sheet names to DataFrames
+        target_rows: Target-date row index per sheet
+        router: Output router installed as sys.stdout, used to capture the job's output
+
+    Returns:
+        Tuple of (succeeded, updated sheet name or None, captured console output)
+    """
+    router.start_capture()
+    updated_sheet = None
+    try:
+        updated_sheet = process_file(job_config, flow_map, target_date, all_sheets, target_rows)
+        succeeded = True
+    except Exception as e:
+        print(f"[ERROR] Job failed: {str(e)}")
+        succeeded = False
+    return succeeded, updated_sheet, router.stop_capture()
 
 
 def main():
@@ -1058,7 +1484,8 @@ def main():
     This function orchestrates the entire synchronization process:
     1. Reads the source file and creates the flow lookup map
     2. Gets today's date
-    3. Processes each destination file according to its job configuration
+    3. Processes each destination sheet according to its job configuration
+    4. Saves the updated workbook once
     """
     print("="*80)
     print("ETF FLOW DATA SYNCHRONIZATION SCRIPT")
@@ -1101,225 +1528,45 @@ def main():
     if len(dest_files) > 1:
         print(f"[WARNING] Multiple Excel files found in {DESTINATION_DIR}, using first one: {DESTINATION_FILE}")
 
-    # Master configuration list for all 24 jobs
-    ALL_JOBS = [
-        # --- Complex (Multi-Column) Files ---
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - S&P 500 ETF.csv",
-            "type": "complex",
-            "mapping": {
-                "IVV ": "IVV US",
-                "SPY ": "SPY US",
-                "UPRO (3x L)": "UPRO US",
-                "SPXL (3x L)": "SPXL US",
-                "SPXS (3x S)": "SPXS US",
-                "SPXU (3x S)": "SPXU US",
-            }
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - Nasdaq 100 ETF.csv",
-            "type": "complex",
-            "mapping": {
-                "QQQ": "QQQ US",
-                "QQQM": "QQQM US",
-                "TQQQ (3x L)": "TQQQ US",
-                "SQQQ (3x S)": "SQQQ US",
-            }
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - Russel 2000 ETF.csv",
-            "type": "complex",
-            "mapping": {
-                "IWM": "IWM US",
-                "VTWO": "VTWO US",
-                "TNA (3x L)": "TNA US",
-            }
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - Bonds.csv",
-            "type": "complex",
-            "mapping": {
-                "TLT": "TLT US",
-                "TMF (3x L)": "TMF US",
-            }
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - Gold ETF.csv",
-            "type": "complex",
-            "mapping": {
-                "GLD": "GLD US",
-                "IAU": "IAU US",
-                "GLDM": "GLDM US",
-            }
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - Silver ETF.csv",
-            "type": "complex",
-            "mapping": {
-                "SLV ": "SLV US",
-                "SIVR": "SIVR US",
-                "AGQ(2x L)": "AGQ US",
-                "ZSL(2x S)": "ZSL US",
-            }
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - Brent ETF.csv",
-            "type": "complex",
-            "mapping": {
-                "BNO": "BNO US",
-                "DBO": "DBO US",
-                "USO": "USO US",
-                "UCO(2x L)": "UCO US",
-                "SCO(2x S)": "SCO US",
-            }
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - Natural Gas.csv",
-            "type": "complex",
-            "mapping": {
-                "BOIL": "BOIL US",
-                "FCG": "FCG US",
-                "KOLD(2x S)": "KOLD US",
-                "UNG": "UNG US",
-            }
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - Platinum ETF.csv",
-            "type": "complex",
-            "mapping": {
-                "PPLT": "PPLT US",
-                "PLTM": "PLTM US",
-            }
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - SEMIC.csv",
-            "type": "complex",
-            "mapping": {
-                "SMH": "SMH US",
-                "SOXX": "SOXX US",
-                "SOXS (3X S)": "SOXS US",
-            }
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - NVDA.csv",
-            "type": "complex",
-            "mapping": {
-                "NVDL (2x L)": "NVDL US",
-                "NVD (2x S)": "NVD US",
-                "NVDX(2x L)": "NVDX US",
-                "NVDU(2x L)": "NVDU US",
-            }
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - AVGO.csv",
-            "type": "complex",
-            "mapping": {
-                "AVGG(2x L)": "AVGG US",
-                "AVGU(2x L)": "AVGU US",
-                "AVGX(2x L)": "AVGX US",
-                "AVL(2x L)": "AVL US",
-                "AVS(1xS)": "AVDS US",
-            }
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - TSLA.csv",
-            "type": "complex",
-            "mapping": {
-                "TSLQ (2x S)": "TSLQ US",
-                " TSLT (2x L)": "TSLT US",
-                "TSLL (2x L)": "TSLL US",
-                "TSL(1.25x L)": "TSL US",
-                "TSLR(2x L)": "TSLR US",
-                "TSDD(2x S)": "TSDD US",
-            }
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - META.csv",
-            "type": "complex",
-            "mapping": {
-                "METU (2x L)": "METU US",
-                "METD (1x S)": "METD US",
-                "FBL (2x L)": "FBL US",
-            }
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - AAPL.csv",
-            "type": "complex",
-            "mapping": {
-                "AAPU (2x L)": "AAPU US",
-                "AAPD (1x S)": "AAPD US",
-                "AAPB(2x L) ": "AAPB US",
-            }
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - MSFT.csv",
-            "type": "complex",
-            "mapping": {
-                "MSFL (2x L)": "MSFL US",
-                "MSFU (2x L)": "MSFU US",
-                "MSFX (2x L)": "MSFX US",
-            }
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - GOOG.csv",
-            "type": "complex",
-            "mapping": {
-                "GGLL (2x L)": "GGLL US",
-                "GGLS (1x S)": "GGLS US",
-            }
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - PANW.csv",
-            "type": "complex",
-            "mapping": {
-                "PALU (2x L)": "PALU US",
-                "PANG (2X L)": "PANG US",
+    # Job configurations, one per destination sheet
+    try:
+        ALL_JOBS = load_job_configs(JOBS_FILE)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] Could not read job configuration {JOBS_FILE}: {str(e)}")
+        sys.exit(1)
+
+    for job in ALL_JOBS:
+        prepare_job_config(job)
+
+    # Destination sheet of every job
+    sheet_names = [job['sheet_name'] for job in ALL_JOBS if job.get('sheet_name')]
+
+    # Load the job sheets of the destination workbook once; jobs update this dict in memory.
+    # Sheets no job touches are never parsed. A missing sheet fails only its own job.
+    workbook_path = str(DESTINATION_DIR / DESTINATION_FILE)
+    print(f"\n[INFO] Loading destination workbook: {workbook_path}")
+    try:
+        with pd.ExcelFile(workbook_path, engine=EXCEL_READ_ENGINE) as workbook:
+            all_sheets = {
+                name: workbook.parse(name)
+                for name in dict.fromkeys(sheet_names) if name in workbook.sheet_names
             }
-        },
-
-        # --- Simple (Single-Column) Files ---
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - Copper ETF.csv",
-            "type": "simple",
-            "ticker": "CPER US",
-            "flow_column": "CPER"
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - Palladium ETF.csv",
-            "type": "simple",
-            "ticker": "PALL US",
-            "flow_column": "PALL"
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - IBIT.csv",
-            "type": "simple",
-            "ticker": "IBIT US",
-            "flow_column": "Flow"
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - ETHA.csv",
-            "type": "simple",
-            "ticker": "ETHA US",
-            "flow_column": "Flow"
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - SOL.csv",
-            "type": "simple",
-            "ticker": "SOL US",
-            "flow_column": "Flow"
-        },
-        {
-            "file_path": f"{DESTINATION_DIR / DESTINATION_FILE} - BOFA.csv",
-            "type": "simple",
-            "ticker": "BOFA US",
-            "flow_column": "BOFA"
-        },
-    ]
+    except Exception as e:
+        print(f"\n[ERROR] Fatal error reading destination workbook: {str(e)}")
+        sys.exit(1)
+
+    # Report every job sheet missing from the workbook up front, before any job runs
+    missing_sheets = [name for name in dict.fromkeys(sheet_names) if name not in all_sheets]
+    if missing_sheets:
+        print(f"[WARNING] Sheet(s) not found in destination workbook: {', '.join(missing_sheets)}")
 
     # Get yesterday's date
     yesterday_date = (datetime.today() - timedelta(days=1)).strftime("%Y-%m-%d")
     print(f"\n[INFO] Processing date: {yesterday_date} (yesterday)")
 
+    # Locate yesterday's row in every sheet once, up front
+    target_rows = find_target_rows(all_sheets, yesterday_date)
+
     # Step 1: Create the flow lookup map from the source file
     try:
         flow_map = create_flow_lookup(SOURCE_FILE)
@@ -1330,46 +1577,80 @@ def main():
         print(f"\n[ERROR] Fatal error reading source file: {str(e)}")
         sys.exit(1)
 
+    # Index the lookup map as a Series so each job can resolve all its tickers at once
+    flow_series = pd.Series(flow_map, dtype='float64')
+
+    # Fetch the price data behind every sheet's VWAP in batched requests up front
+    vwap_tickers = [get_vwap_ticker_for_sheet(name) for name in sheet_names]
+    prefetch_vwaps([ticker for ticker in vwap_tickers if ticker], yesterday_date)
+
     # Step 2: Process each destination file
     print(f"\n[INFO] Starting to process {len(ALL_JOBS)} job(s)...")
 
     success_count = 0
     failure_count = 0
+    updated_sheets = []
 
-    for idx, job in enumerate(ALL_JOBS, 1):
-        print(f"\n{'='*80}")
-        print(f"JOB {idx}/{len(ALL_JOBS)}")
-        print(f"{'='*80}")
-
-        try:
-            process_file(job, flow_map, yesterday_date)
-            success_count += 1
-        except Exception as e:
-            print(f"[ERROR] Job failed: {str(e)}")
-            failure_count += 1
-            # Continue to the next job even if this one failed
-            continue
-
-    # Create ALL statistics sheet
+    # Jobs run concurrently; each job's output is buffered and printed in job order.
+    # A failed job is counted and the remaining jobs still run.
+    router = ThreadOutputRouter(sys.stdout)
+    sys.stdout = router
     try:
-        # Extract sheet names from job configurations
-        sheet_names = []
-        for job in ALL_JOBS:
-            file_path = job['file_path']
-            parts = file_path.split(' - ')
-            if len(parts) >= 2:
-                sheet_name = parts[1].replace('.csv', '').strip()
-                sheet_names.append(sheet_name)
-
-        # Get the workbook path
-        workbook_path = str(DESTINATION_DIR / DESTINATION_FILE)
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_JOB_WORKERS, len(ALL_JOBS)))) as executor:
+            results = executor.map(
+                lambda job: run_job(job, flow_series, yesterday_date, all_sheets, target_rows, router),
+                ALL_JOBS
+            )
+
+            for idx, (succeeded, updated_sheet, output) in enumerate(results, 1):
+                print(f"\n{'='*80}")
+                print(f"JOB {idx}/{len(ALL_JOBS)}")
+                print(f"{'='*80}")
+                print(output, end='')
+
+                if succeeded:
+                    success_count += 1
+                else:
+                    failure_count += 1
+                if updated_sheet:
+                    updated_sheets.append(updated_sheet)
+    finally:
+        sys.stdout = router.stream
+
+    # Step 3: Open the destination once, write the changed cells of the updated
+    # sheets, rebuild the ALL dashboard from the result and save once
+    try:
+        wb = load_workbook(workbook_path)
+        cells_written = write_workbook_updates(wb, all_sheets, updated_sheets)
+    except Exception as e:
+        print(f"\n[ERROR] Failed to update destination workbook: {str(e)}")
+        sys.exit(1)
 
-        # Create the ALL statistics dashboard
-        create_all_statistics_sheet(workbook_path, sheet_names)
+    # With no cell changed (e.g. a re-run for a day already processed) an existing
+    # dashboard would be rebuilt from the same values, so the file is left untouched.
+    # A missing dashboard (never built, or dropped after a failed rebuild) is built anyway
+    if not cells_written and 'ALL' in wb.sheetnames:
+        print("\n[INFO] No changes; skipping ALL dashboard rebuild and save")
+    else:
+        try:
+            # Create the ALL statistics dashboard
+            create_all_statistics_sheet(wb, sheet_names)
 
-    except Exception as e:
-        print(f"[WARNING] Could not create ALL statistics sheet: {str(e)}")
-        # Don't fail the entire process if ALL sheet creation fails
+        except Exception as e:
+            print(f"[WARNING] Could not create ALL statistics sheet: {str(e)}")
+            # Don't fail the entire process if ALL sheet creation fails, but drop the
+            # out-of-date dashboard so the next run rebuilds it even with no changes
+            if 'ALL' in wb.sheetnames:
+                wb.remove(wb['ALL'])
+                print("[WARNING] Removed the out-of-date ALL sheet; it will be rebuilt on the next run")
+
+        if cells_written or 'ALL' in wb.sheetnames:
+            try:
+                wb.save(workbook_path)
+                print(f"\n[SUCCESS] Saved changes to: {workbook_path}")
+            except Exception as e:
+                print(f"\n[ERROR] Failed to save destination workbook: {str(e)}")
+                sys.exit(1)
 
     # Summary
     print(f"\n{'='*80}")
@@ -0,0 +1,247 @@
+"""
+Tests for sync_etf_flows.py
+
+Run from the project folder:
+    python -m unittest discover -s tests
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+
+import sync_etf_flows
+
+
+class LocateFlowColumnsTest(unittest.TestCase):
+    """Source header parsing in _locate_flow_columns."""
+
+    def test_flow_before_unit(self):
+        header = ['Ticker', 'Name', '1D Flow (M USD)']
+        self.assertEqual(sync_etf_flows._locate_flow_columns(header, 'Sheet'), (0, 2))
+
+    def test_unit_before_flow(self):
+        header = ['Ticker', 'Name', '(M USD) Net Flow']
+        self.assertEqual(sync_etf_flows._locate_flow_columns(header, 'Sheet'), (0, 2))
+
+    def test_wrapped_header_in_either_order(self):
+        for flow_header in ('1D Flow\n(M USD)', '(M USD)\nFlow'):
+            with self.subTest(flow_header=flow_header):
+                header = ['Ticker', 'Name', flow_header]
+                self.assertEqual(sync_etf_flows._locate_flow_columns(header, 'Sheet'), (0, 2))
+
+    def test_outflow_is_not_matched(self):
+        header = ['Ticker', 'Outflow (M USD)', '1D Flow (M USD)']
+        self.assertEqual(sync_etf_flows._locate_flow_columns(header, 'Sheet'), (0, 2))
+
+    def test_bare_unit_header(self):
+        header = ['Ticker', 'Name', ' (M USD)']
+        self.assertEqual(sync_etf_flows._locate_flow_columns(header, 'Sheet'), (0, 2))
+
+    def test_unit_without_flow_is_not_matched(self):
+        header = ['Ticker', 'Name', 'AUM (M USD)']
+        self.assertIsNone(sync_etf_flows._locate_flow_columns(header, 'Sheet'))
+
+
+class LoadJobConfigsTest(unittest.TestCase):
+    """Job file validation in load_job_configs."""
+
+    def _load(self, jobs):
+        with tempfile.TemporaryDirectory() as tmp:
+            jobs_file = Path(tmp) / 'jobs.json'
+            jobs_file.write_text(json.dumps(jobs), encoding='utf-8')
+            return sync_etf_flows.load_job_configs(jobs_file)
+
+    def test_shipped_jobs_load(self):
+        jobs = sync_etf_flows.load_job_configs(sync_etf_flows.JOBS_FILE)
+        self.assertTrue(jobs)
+
+    def test_duplicate_sheet_name_is_rejected(self):
+        jobs = [
+            {'sheet_name': 'S&P 500 ETF', 'type': 'simple', 'ticker': 'IVV US', 'flow_column': 'IVV'},
+            {'sheet_name': 'S&P 500 ETF', 'type': 'simple', 'ticker': 'SPY US', 'flow_column': 'SPY'},
+        ]
+        with self.assertRaisesRegex(ValueError, 'S&P 500 ETF'):
+            self._load(jobs)
+
+
+class WriteSheetUpdatesTest(unittest.TestCase):
+    """Cell diffing and appended-row styling in write_sheet_updates."""
+
+    def setUp(self):
+        # Header, two dated rows, then a statistics label in the first free row
+        self.wb = Workbook()
+        self.ws = self.wb.active
+        self.ws.append(['Date', 'IBIT'])
+        self.ws.append([datetime(2025, 11, 14), 1.0])
+        self.ws.append([datetime(2025, 11, 17), 2.0])
+        self.ws['B3'].number_format = '#,##0.00'
+        self.ws.append([None, 'LAST 20 DAYS'])
+        self.ws['B4'].font = Font(bold=True, italic=True)
+
+    def test_appended_row_takes_style_of_last_dated_row(self):
+        df = pd.DataFrame({
+            'Date': [datetime(2025, 11, 14), datetime(2025, 11, 17), None, datetime(2025, 11, 18)],
+            'IBIT': [1.0, 2.0, 'LAST 20 DAYS', 3.0],
+        })
+        self.assertEqual(sync_etf_flows.write_sheet_updates(self.ws, df), 2)
+
+        self.assertEqual(self.ws['B5'].value, 3.0)
+        self.assertEqual(self.ws['B5'].number_format, '#,##0.00')
+        self.assertFalse(self.ws['B5'].font.b)
+        self.assertFalse(self.ws['B5'].font.i)
+
+    def test_unchanged_cells_are_not_written(self):
+        df = pd.DataFrame({
+            'Date': [datetime(2025, 11, 14), datetime(2025, 11, 17), None],
+            'IBIT': [1.0, 2.0, 'LAST 20 DAYS'],
+        })
+        self.assertEqual(sync_etf_flows.write_sheet_updates(self.ws, df), 0)
+
+
+def _batched_bars(index, bars):
+    """Frame shaped like yf.download(group_by='ticker'): one (ticker, field) column per bar field."""
+    columns = pd.MultiIndex.from_tuples(
+        [(ticker, field) for ticker in bars for field in ('High', 'Low', 'Close', 'Volume')])
+    data = {(ticker, field): values[i] for ticker, values in bars.items()
+            for i, field in enumerate(('High', 'Low', 'Close', 'Volume'))}
+    return pd.DataFrame(data, index=index, columns=columns)
+
+
+class PrefetchVwapsTest(unittest.TestCase):
+    """Batched VWAP prefetch in prefetch_vwaps."""
+
+    DATE = '2025-11-18'
+
+    def setUp(self):
+        nan = float('nan')
+        # AAA has two 5-minute bars; BBB is in the batch but has no intraday bars
+        self.intraday = _batched_bars(
+            pd.date_range('2025-11-18 09:30', periods=2, freq='5min'),
+            {'AAA': ([11.0, 13.0], [9.0, 11.0], [10.0, 12.0], [100.0, 300.0]),
+             'BBB': ([nan, nan], [nan, nan], [nan, nan], [nan, nan])})
+        # Only BBB has daily bars; CCC is in neither download
+        self.daily = _batched_bars(
+            pd.to_datetime(['2025-11-17', '2025-11-18']),
+            {'BBB': ([20.0, 22.0], [18.0, 19.0], [19.0, 21.0], [1000.0, 1000.0])})
+
+        self.requests = []
+        patcher = mock.patch.dict(sync_etf_flows._VWAP_CACHE, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _download(self, tickers, **kwargs):
+        self.requests.append((list(tickers), kwargs.get('interval', '1d')))
+        return self.intraday if kwargs.get('interval') == '5m' else self.daily
+
+    def _prefetch(self):
+        with mock.patch.object(sync_etf_flows.yf, 'download', self._download), \
+                contextlib.redirect_stdout(io.StringIO()):
+            sync_etf_flows.prefetch_vwaps(['AAA', 'BBB', 'CCC'], self.DATE)
+
+    def test_intraday_bars_fill_cache(self):
+        self._prefetch()
+        # (10 * 100 + 12 * 300) / 400
+        self.assertEqual(sync_etf_flows._VWAP_CACHE[('AAA', self.DATE)], 11.5)
+
+    def test_daily_bar_used_without_intraday_data(self):
+        self._prefetch()
+        # (22 + 19 + 21) / 3
+        self.assertEqual(sync_etf_flows._VWAP_CACHE[('BBB', self.DATE)], 20.67)
+        self.assertEqual(self.requests, [(['AAA', 'BBB', 'CCC'], '5m'), (['BBB', 'CCC'], '1d')])
+
+    def test_missing_ticker_is_fetched_per_ticker(self):
+        self._prefetch()
+        self.assertNotIn(('CCC', self.DATE), sync_etf_flows._VWAP_CACHE)
+
+        with mock.patch.object(sync_etf_flows, '_download_vwap', return_value=42.0) as download:
+            self.assertEqual(sync_etf_flows.fetch_vwap_for_date('AAA', self.DATE), 11.5)
+            self.assertEqual(sync_etf_flows.fetch_vwap_for_date('CCC', self.DATE), 42.0)
+        download.assert_called_once_with('CCC', self.DATE)
+
+
+class _FixedToday(datetime):
+    """datetime whose today() is 2025-11-19, so the run processes 2025-11-18."""
+
+    @classmethod
+    def today(cls):
+        return cls(2025, 11, 19)
+
+
+class RerunTest(unittest.TestCase):
+    """Running main() twice for the same day must leave the destination untouched."""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        shutil.copytree(PROJECT_DIR / 'Source', Path(self.work_dir) / 'Source')
+        shutil.copytree(PROJECT_DIR / 'Destination', Path(self.work_dir) / 'Destination')
+        self.old_cwd = os.getcwd()
+        os.chdir(self.work_dir)
+
+    def tearDown(self):
+        os.chdir(self.old_cwd)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _run_main(self):
+        # Fixed VWAP and no network: the same day always produces the same values
+        with mock.patch.object(sync_etf_flows, 'datetime', _FixedToday), \
+                mock.patch.object(sync_etf_flows, 'prefetch_vwaps', lambda *args: None), \
+                mock.patch.object(sync_etf_flows, 'fetch_vwap_for_date', lambda ticker, date: 100.0), \
+                contextlib.redirect_stdout(io.StringIO()):
+            try:
+                sync_etf_flows.main()
+            except SystemExit:
+                pass
+
+    @staticmethod
+    def _sheet_names(workbook):
+        wb = load_workbook(workbook, read_only=True)
+        try:
+            return wb.sheetnames
+        finally:
+            wb.close()
+
+    def test_failed_dashboard_is_rebuilt_on_unchanged_rerun(self):
+        workbook = next(Path('Destination').glob('*.xlsx'))
+
+        def fail(*args):
+            raise RuntimeError('dashboard failure')
+
+        with mock.patch.object(sync_etf_flows, 'create_all_statistics_sheet', fail):
+            self._run_main()
+        self.assertNotIn('ALL', self._sheet_names(workbook))
+
+        # No cell changes on the second run, but the missing dashboard is built and saved
+        self._run_main()
+        self.assertIn('ALL', self._sheet_names(workbook))
+
+    def test_same_day_rerun_does_not_rewrite_workbook(self):
+        workbook = next(Path('Destination').glob('*.xlsx'))
+        original = workbook.read_bytes()
+
+        self._run_main()
+        first_bytes = workbook.read_bytes()
+        first_mtime = workbook.stat().st_mtime_ns
+        self.assertNotEqual(first_bytes, original)
+
+        self._run_main()
+        self.assertEqual(workbook.read_bytes(), first_bytes)
+        self.assertEqual(workbook.stat().st_mtime_ns, first_mtime)
+
+
+if __name__ == '__main__':
+    unittest.main()